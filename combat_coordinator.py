@@ -41,7 +41,7 @@ class CombatCoordinator:
         
         # Start combat with all adjacent monsters
         monsters_in_combat, surprised_monsters = check_for_combat(player_pos, dungeon.monsters, dungeon)
-        self.combat_manager.start_combat(player, player_pos, monsters_in_combat, surprised_monsters, dungeon.monsters)
+        self.combat_manager.start_combat(player, player_pos, monsters_in_combat, surprised_monsters, dungeon.monsters, dungeon)
         
         # Roll initiative
         dex_modifier = get_stat_modifier(player.dexterity)
@@ -291,8 +291,8 @@ class CombatCoordinator:
                     best_flee_spot = new_pos
         
         if best_flee_spot and calculate_distance(best_flee_spot, player_pos) > calculate_distance((monster.x, monster.y), player_pos):
+            self.combat_manager.update_dungeon_monster_position(monster, *best_flee_spot)
             monster.x, monster.y = best_flee_spot
-            self.combat_manager.update_dungeon_monster_position(monster, monster.x, monster.y)
             self.combat_manager.log_message(f"{monster.name} flees to ({monster.x}, {monster.y})!")
         else:
             self.combat_manager.log_message(f"{monster.name} is cornered and can't flee!")
@@ -322,8 +322,8 @@ class CombatCoordinator:
                     best_move = new_pos
         
         if best_move != (monster.x, monster.y):
+            self.combat_manager.update_dungeon_monster_position(monster, *best_move)
             monster.x, monster.y = best_move
-            self.combat_manager.update_dungeon_monster_position(monster, monster.x, monster.y)
             self.combat_manager.log_message(f"{monster.name} moves closer!")
         else:
             self.combat_manager.log_message(f"{monster.name} holds its position.")
@@ -350,4 +350,5 @@ class CombatCoordinator:
 
         # Remove dead monsters
         for dead_monster in monsters_to_remove:
-            dungeon.monsters.remove(dead_monster)
\ No newline at end of file
+            dungeon.monsters.remove(dead_monster)
+        dungeon.reindex_monsters()
\ No newline at end of file
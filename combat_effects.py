@@ -3,6 +3,7 @@ import pygame
 import math
 import random
 import time
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
@@ -354,6 +355,21 @@ def apply_damage_effects(effects_manager: CombatEffectsManager, damage: int, tar
             color = (255, 215, 0) if is_critical else (255, 0, 0)  # Gold for crit, red for normal
             effects_manager.add_screen_flash(color, 0.15, intensity)
 
+# Shared by sprite glyphs and combat UI text; bounded so callers handing in
+# fresh Font objects cannot grow it without limit
+@lru_cache(maxsize=384)
+def _render_text(font: pygame.font.Font, text: str, rgb: Tuple[int, ...]) -> pygame.Surface:
+    return font.render(text, True, rgb)
+
+def render_cached_text(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    """Render text in a colour, reusing the surface while the same text stays on screen"""
+    # pygame.Color is unhashable, so the cache is keyed on its tuple form
+    return _render_text(font, text, tuple(color))
+
+def get_sprite_surface(font: pygame.font.Font, sprite_char: str, color) -> pygame.Surface:
+    """Get a sprite glyph rendered in a colour, reusing earlier renders"""
+    return render_cached_text(font, sprite_char, color)
+
 def draw_sprite_with_flash(surface: pygame.Surface, sprite_char: str, font: pygame.font.Font, 
                           pos: Tuple[int, int], color: Tuple[int, int, int], 
                           effects_manager: CombatEffectsManager, world_x: int, world_y: int):
@@ -362,11 +378,9 @@ def draw_sprite_with_flash(surface: pygame.Surface, sprite_char: str, font: pyga
     
     if should_flash:
         # Flash effect: alternate between white and original color
-        flash_color = COLOR_WHITE
-        sprite_surf = font.render(sprite_char, True, flash_color)
-    else:
-        sprite_surf = font.render(sprite_char, True, color)
+        color = COLOR_WHITE
     
+    sprite_surf = get_sprite_surface(font, sprite_char, color)
     sprite_rect = sprite_surf.get_rect(center=pos)
     surface.blit(sprite_surf, sprite_rect)
 
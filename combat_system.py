@@ -4,6 +4,7 @@ import random
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict
+from combat_effects import render_cached_text
 
 class CombatState(Enum):
     NOT_IN_COMBAT = 0
@@ -55,8 +56,10 @@ class CombatManager:
         self.surprise_participants = []
         # Add reference to dungeon monsters for position updates
         self.dungeon_monsters = []
+        # Dungeon whose monster position index must follow combat moves
+        self.dungeon = None
         
-    def start_combat(self, player, player_pos, monsters, surprised_monsters=None, dungeon_monsters=None):
+    def start_combat(self, player, player_pos, monsters, surprised_monsters=None, dungeon_monsters=None, dungeon=None):
         """Initialize combat with player and monsters"""
         self.state = CombatState.INITIATIVE_ROLL
         self.participants = []
@@ -64,6 +67,7 @@ class CombatManager:
         self.surprise_participants = []
         # Store reference to the dungeon monsters list for position updates
         self.dungeon_monsters = dungeon_monsters if dungeon_monsters else monsters
+        self.dungeon = dungeon
         
         # Add player to combat
         player_combat = CombatParticipant(
@@ -289,8 +293,11 @@ class CombatManager:
             if (dungeon_monster.x == combat_monster.x and 
                 dungeon_monster.y == combat_monster.y and 
                 dungeon_monster.name == combat_monster.name):
-                dungeon_monster.x = new_x
-                dungeon_monster.y = new_y
+                if self.dungeon is not None:
+                    self.dungeon.move_monster(dungeon_monster, new_x, new_y)
+                else:
+                    dungeon_monster.x = new_x
+                    dungeon_monster.y = new_y
                 break
     
     def get_monsters_in_combat(self):
@@ -484,7 +491,7 @@ def draw_combat_ui(surface, combat_manager, font, small_font):
     current = combat_manager.get_current_participant()
     if current:
         turn_text = f"{current.name}'s Turn"
-        turn_surf = font.render(turn_text, True, (255, 255, 0))
+        turn_surf = render_cached_text(font, turn_text, (255, 255, 0))
         turn_rect = turn_surf.get_rect(centerx=screen_width//2, top=10)
         
         bg_rect = turn_rect.inflate(20, 10)
@@ -508,7 +515,7 @@ def draw_combat_log(surface, combat_manager, font, small_font):
     pygame.draw.rect(surface, (0, 0, 0, 200), log_rect)
     pygame.draw.rect(surface, (255, 255, 255), log_rect, 2)
     
-    title_surf = font.render("Combat Log", True, (255, 255, 255))
+    title_surf = render_cached_text(font, "Combat Log", (255, 255, 255))
     surface.blit(title_surf, (log_x + 10, log_y + 10))
     
     start_y = log_y + 40
@@ -521,7 +528,7 @@ def draw_combat_log(surface, combat_manager, font, small_font):
         if len(message) > 50:
             message = message[:47] + "..."
         
-        message_surf = small_font.render(message, True, (255, 255, 255))
+        message_surf = render_cached_text(small_font, message, (255, 255, 255))
         surface.blit(message_surf, (log_x + 10, start_y + i * line_height))
 
 def draw_combat_action_menu(surface, selected_action, font, small_font):
@@ -1,8 +1,9 @@
 # dungeon_classes.py - Fixed version with automatic boulder pushing
 import random
-from typing import List, Tuple, Dict, Set, Optional
+from collections import deque
+from typing import List, Tuple, Dict, Set, Optional, Iterable
 from dataclasses import dataclass
-from game_constants import TileType
+from game_constants import TileType, CLOSED_DOOR_TILES
 from puzzle_system import (
     PuzzleManager, generate_boulder_puzzle, should_generate_puzzle,
     Boulder, PressurePlate, Glyph, Barrier, Altar, Chest
@@ -11,6 +12,35 @@ from puzzle_system import (
 # Import the new monster system
 from monster_system import MonsterInstance, spawn_random_monster, get_monster_database
 
+# Door type classification, built once instead of per-lookup lists
+_OPEN_PASSAGE_DOOR_TYPES = frozenset({0, 2})      # No Door, Open Door
+_STAIRS_DOOR_TYPES = frozenset({3, 7, 9})
+_SECRET_DOOR_TYPE = 6
+_CLOSED_DOOR_TYPES = frozenset({1, 5})            # Door, Locked Door
+_OPENABLE_DOOR_TYPES = _CLOSED_DOOR_TYPES | {_SECRET_DOOR_TYPE}
+_PASSABLE_DOOR_TYPES = _OPEN_PASSAGE_DOOR_TYPES | _STAIRS_DOOR_TYPES
+
+# Tiles players/monsters can move onto
+_PLAYER_PASSABLE_TILES = frozenset({
+    TileType.FLOOR, TileType.DOOR_OPEN, TileType.NOTE,
+    TileType.STAIRS_HORIZONTAL, TileType.STAIRS_VERTICAL,
+    TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL,
+    TileType.PRESSURE_PLATE, TileType.PRESSURE_PLATE_ACTIVE,
+    TileType.GLYPH, TileType.GLYPH_ACTIVE
+})
+
+# 4-way neighbour offsets used for pathing
+_NEIGHBOR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Tiles boulders can be pushed onto
+_BOULDER_PASSABLE_TILES = frozenset({
+    TileType.FLOOR,
+    TileType.PRESSURE_PLATE,
+    TileType.PRESSURE_PLATE_ACTIVE,
+    TileType.GLYPH,
+    TileType.GLYPH_ACTIVE
+})
+
 @dataclass
 class Room:
     id: int
@@ -64,8 +94,21 @@ class DungeonExplorer:
         self.columns: List[Column] = []
         self.water_tiles: List[WaterTile] = []
         self.tiles: Dict[Tuple[int, int], TileType] = {}
+        # Row-major copy of tiles over self.bounds, index (y - min_y) * width + (x - min_x)
+        self.tile_grid: List[TileType] = []
+        # 1 for each revealed cell, same layout as tile_grid
+        self.revealed_grid = bytearray()
         self.revealed_rooms: Set[int] = set()
+        # Bumped whenever a tile or the revealed area changes, so renderers can cache
+        self.world_version = 0
         self.monsters: List[MonsterInstance] = []
+        self.monster_by_pos: Dict[Tuple[int, int], MonsterInstance] = {}
+        self.monsters_by_room: Dict[int, List[MonsterInstance]] = {}
+        
+        # Player-walkable cells, kept up to date as rooms are revealed and tiles change
+        self.player_walkable: Set[Tuple[int, int]] = set()
+        self._monster_walkable_cache: Set[Tuple[int, int]] = set()
+        self._monster_walkable_dirty = True
         
         # Puzzle system
         self.puzzle_manager = PuzzleManager()
@@ -73,6 +116,7 @@ class DungeonExplorer:
         self._parse_data(dungeon_data)
         self._generate_tiles()
         self._generate_puzzles()
+        self._build_tile_grid()
         self._spawn_monsters()
         
         # Reveal the room at the starting position
@@ -160,6 +204,7 @@ class DungeonExplorer:
         max_y = max(room.y + room.height for room in self.rooms.values()) + 3
         
         self.bounds = (min_x, min_y, max_x - min_x, max_y - min_y)
+        self.revealed_grid = bytearray((max_x - min_x) * (max_y - min_y))
         
         # Initialize as void
         for y in range(min_y, max_y):
@@ -176,17 +221,17 @@ class DungeonExplorer:
             if door.is_open:
                 self.tiles[(door.x, door.y)] = TileType.DOOR_OPEN
             # Types 0 (No Door) and 2 (Open Door) are just open passages
-            elif door.type in [0, 2]:
+            elif door.type in _OPEN_PASSAGE_DOOR_TYPES:
                 self.tiles[(door.x, door.y)] = TileType.DOOR_OPEN
             # Types 3, 7, and 9 are stairs
-            elif door.type in [3, 7, 9]:
+            elif door.type in _STAIRS_DOOR_TYPES:
                 self.tiles[(door.x, door.y)] = TileType.STAIRS_HORIZONTAL if door.is_horizontal else TileType.STAIRS_VERTICAL
             # Type 6 is a secret door, which initially appears as a wall.
-            elif door.type == 6:
+            elif door.type == _SECRET_DOOR_TYPE:
                 # It's treated as a floor tile, but the wall drawing logic will draw a wall over it.
                 continue
             # Types 1 (Door) and 5 (Locked Door) are standard doors
-            elif door.type in [1, 5]:
+            elif door.type in _CLOSED_DOOR_TYPES:
                 self.tiles[(door.x, door.y)] = TileType.DOOR_HORIZONTAL if door.is_horizontal else TileType.DOOR_VERTICAL
         
         # Place notes
@@ -194,6 +239,23 @@ class DungeonExplorer:
             if (note.x, note.y) in self.tiles:
                 self.tiles[(note.x, note.y)] = TileType.NOTE
     
+    def _build_tile_grid(self):
+        """Flatten the generated tiles into tile_grid."""
+        min_x, min_y, width, height = self.bounds
+        tiles = self.tiles
+        self.tile_grid = [tiles.get((x, y), TileType.VOID)
+                          for y in range(min_y, min_y + height)
+                          for x in range(min_x, min_x + width)]
+    
+    def tile_at(self, x: int, y: int) -> TileType:
+        """Tile at a world position; VOID outside the dungeon bounds."""
+        min_x, min_y, width, height = self.bounds
+        gx = x - min_x
+        gy = y - min_y
+        if 0 <= gx < width and 0 <= gy < height:
+            return self.tile_grid[gy * width + gx]
+        return TileType.VOID
+    
     def _generate_puzzles(self):
         """Generate puzzles for eligible rooms"""
         for room in self.rooms.values():
@@ -208,36 +270,33 @@ class DungeonExplorer:
     def _place_puzzle_tiles(self, puzzle):
         """Place puzzle element tiles in the dungeon"""
         # Place altar
-        for altar in puzzle.elements["altars"]:
+        for altar in puzzle.altars:
             self.tiles[(altar.x, altar.y)] = TileType.ALTAR
         
         # Place boulders
-        for boulder in puzzle.elements["boulders"]:
+        for boulder in puzzle.boulders:
             self.tiles[(boulder.x, boulder.y)] = TileType.BOULDER
         
         # Place pressure plates
-        for plate in puzzle.elements["pressure_plates"]:
+        for plate in puzzle.pressure_plates:
             self.tiles[(plate.x, plate.y)] = TileType.PRESSURE_PLATE
         
         # Place glyphs
-        for glyph in puzzle.elements["glyphs"]:
+        for glyph in puzzle.glyphs:
             self.tiles[(glyph.x, glyph.y)] = TileType.GLYPH
         
         # Place barriers
-        for barrier in puzzle.elements["barriers"]:
+        for barrier in puzzle.barriers:
             self.tiles[(barrier.x, barrier.y)] = TileType.BARRIER
         
         # Place chests
-        for chest in puzzle.elements["chests"]:
+        for chest in puzzle.chests:
             self.tiles[(chest.x, chest.y)] = TileType.CHEST
 
     def _spawn_monsters(self):
         """Spawns monsters in rooms based on a random chance, avoiding puzzle rooms."""
         # Initialize the monster database
-        monster_db = get_monster_database()
-        print(f"Monster database loaded with {len(monster_db.list_monsters())} monster types:")
-        for monster_name in monster_db.list_monsters():
-            print(f"  - {monster_name}")
+        get_monster_database()
         
         start_pos = self.get_starting_position()
         start_room_id = -1
@@ -274,12 +333,53 @@ class DungeonExplorer:
                     monster = spawn_random_monster(x, y, room_id, level_range)
                     if monster:
                         self.monsters.append(monster)
+                        self.monster_by_pos[(x, y)] = monster
+                        self.monsters_by_room.setdefault(room_id, []).append(monster)
                         print(f"Spawned {monster.name} at ({x}, {y}) in room {room_id}")
                     else:
                         print(f"Failed to spawn monster at ({x}, {y})")
         
         print(f"Total monsters spawned: {len(self.monsters)}")
 
+    def bfs_from(self, start: Tuple[int, int], walkable: Set[Tuple[int, int]],
+                 goals: Iterable[Tuple[int, int]] = ()) -> Dict[Tuple[int, int], int]:
+        """
+        Step distances from start over walkable cells. If goals are given the
+        search stops once all of them have been reached.
+        """
+        dist = {start: 0}
+        remaining = set(goals)
+        remaining.discard(start)
+        queue = deque((start,))
+        while queue:
+            pos = queue.popleft()
+            next_dist = dist[pos] + 1
+            x, y = pos
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                neighbor = (x + dx, y + dy)
+                if neighbor in walkable and neighbor not in dist:
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
+                    if neighbor in remaining:
+                        remaining.discard(neighbor)
+                        if not remaining:
+                            return dist
+        return dist
+    
+    def move_monster(self, monster: MonsterInstance, x: int, y: int):
+        """Move a monster and keep the position index in sync."""
+        if self.monster_by_pos.get((monster.x, monster.y)) is monster:
+            del self.monster_by_pos[(monster.x, monster.y)]
+        monster.x, monster.y = x, y
+        self.monster_by_pos[(x, y)] = monster
+    
+    def reindex_monsters(self):
+        """Rebuild the monster indexes after monsters were moved or removed externally."""
+        self.monster_by_pos = {(m.x, m.y): m for m in self.monsters}
+        self.monsters_by_room = {}
+        for monster in self.monsters:
+            self.monsters_by_room.setdefault(monster.room_id, []).append(monster)
+
     def reveal_room(self, room_id_to_reveal: int):
         """
         Reveals a given room and recursively reveals any adjacent rooms
@@ -290,6 +390,7 @@ class DungeonExplorer:
 
         # Use a queue for a breadth-first search of connected open rooms
         queue = [room_id_to_reveal]
+        newly_revealed = set()
         
         while queue:
             current_room_id = queue.pop(0)
@@ -298,6 +399,7 @@ class DungeonExplorer:
                 continue
                 
             self.revealed_rooms.add(current_room_id)
+            newly_revealed.add(current_room_id)
             
             # Find all doors connected to the newly revealed room
             for door in self.doors:
@@ -308,36 +410,72 @@ class DungeonExplorer:
                     neighbor_id = door.room1_id
                 
                 # If it's a valid neighbor and the door is an open type, add to queue
-                if neighbor_id >= 0 and door.type in [0, 2, 3, 7, 9]:
+                if neighbor_id >= 0 and door.type in _PASSABLE_DOOR_TYPES:
                     if neighbor_id not in self.revealed_rooms:
                         queue.append(neighbor_id)
+        
+        self.world_version += 1
+        
+        # Only cells of the newly revealed rooms and their doors can change
+        # visibility or walkability
+        changed = set()
+        for room_id in newly_revealed:
+            changed.update(self.rooms[room_id].get_cells())
+        for door in self.doors:
+            if door.room1_id in newly_revealed or door.room2_id in newly_revealed:
+                changed.add((door.x, door.y))
+        self._refresh_revealed(changed)
+        self._refresh_walkable(changed)
+    
+    def apply_walkable_delta(self, added: Set[Tuple[int, int]], removed: Set[Tuple[int, int]]):
+        """Apply a change in player walkability to the cached set in place."""
+        self.player_walkable.difference_update(removed)
+        self.player_walkable.update(added)
+        self._monster_walkable_dirty = True
+    
+    def _refresh_walkable(self, positions):
+        """Recompute player walkability for just the given cells."""
+        added = set()
+        removed = set()
+        for pos in positions:
+            if self.tiles.get(pos) in _PLAYER_PASSABLE_TILES and self.is_revealed(pos[0], pos[1]):
+                if pos not in self.player_walkable:
+                    added.add(pos)
+            elif pos in self.player_walkable:
+                removed.add(pos)
+        if added or removed:
+            self.apply_walkable_delta(added, removed)
+    
+    def _set_tile(self, pos: Tuple[int, int], tile_type: TileType):
+        """Change a tile after generation, keeping the walkable cache in sync."""
+        if self.tiles.get(pos) is not tile_type:
+            self.tiles[pos] = tile_type
+            self.world_version += 1
+            min_x, min_y, width, _ = self.bounds
+            self.tile_grid[(pos[1] - min_y) * width + (pos[0] - min_x)] = tile_type
+            self._monster_walkable_dirty = True
+            self._refresh_walkable((pos,))
+    
+    def get_monster_walkable_positions(self) -> Set[Tuple[int, int]]:
+        """Cells monsters can step onto, rebuilt only after doors or terrain change."""
+        if self._monster_walkable_dirty:
+            tiles = self.tiles
+            self._monster_walkable_cache = {pos for pos in self.player_walkable
+                                            if tiles[pos] not in CLOSED_DOOR_TILES}
+            self._monster_walkable_dirty = False
+        return self._monster_walkable_cache
     
     def get_walkable_positions(self, for_boulders: bool = False) -> Set[Tuple[int, int]]:
         """Determines the set of tiles a character or boulder can move to."""
-        walkable = set()
+        if not for_boulders:
+            # Maintained incrementally; treat the returned set as read-only
+            return self.player_walkable
         
-        if for_boulders:
-            # Boulders can move onto these tiles
-            passable_tiles = {
-                TileType.FLOOR, 
-                TileType.PRESSURE_PLATE, 
-                TileType.PRESSURE_PLATE_ACTIVE,
-                TileType.GLYPH, 
-                TileType.GLYPH_ACTIVE
-            }
-        else:
-            # Players/monsters can move onto these tiles
-            passable_tiles = {
-                TileType.FLOOR, TileType.DOOR_OPEN, TileType.NOTE,
-                TileType.STAIRS_HORIZONTAL, TileType.STAIRS_VERTICAL,
-                TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL,
-                TileType.PRESSURE_PLATE, TileType.PRESSURE_PLATE_ACTIVE,
-                TileType.GLYPH, TileType.GLYPH_ACTIVE
-            }
+        walkable = set()
         
         for pos, tile_type in self.tiles.items():
             # A tile is walkable if its type is passable AND it's in a revealed area.
-            if tile_type in passable_tiles and self.is_revealed(pos[0], pos[1]):
+            if tile_type in _BOULDER_PASSABLE_TILES and self.is_revealed(pos[0], pos[1]):
                  walkable.add(pos)
     
         return walkable
@@ -346,9 +484,10 @@ class DungeonExplorer:
         for door in self.doors:
             if door.x == x and door.y == y and not door.is_open:
                 # Regular (1), locked (5), and secret (6) doors can be "opened"
-                if door.type in [1, 5, 6]:
+                if door.type in _OPENABLE_DOOR_TYPES:
                     door.is_open = True
-                    self.tiles[(door.x, door.y)] = TileType.DOOR_OPEN
+                    self._refresh_revealed(((door.x, door.y),))  # Opened secret doors become visible
+                    self._set_tile((door.x, door.y), TileType.DOOR_OPEN)
                     
                     # Reveal connected rooms, which will cascade if they lead to more open areas
                     if door.room1_id >= 0:
@@ -366,7 +505,7 @@ class DungeonExplorer:
         Returns (success, final_player_position)
         """
         # Check if there's a boulder at the target position
-        boulder = self.puzzle_manager.get_element_at_position(next_pos[0], next_pos[1])
+        boulder = self.puzzle_manager.element_positions.get(next_pos)
         
         if boulder and isinstance(boulder, Boulder):
             # There's a boulder - try to push it
@@ -377,22 +516,28 @@ class DungeonExplorer:
             boulder_walkable = self.get_walkable_positions(for_boulders=True)
             
             # Make sure no other boulder is at the destination
-            existing_element = self.puzzle_manager.get_element_at_position(boulder_dest[0], boulder_dest[1])
+            existing_element = self.puzzle_manager.element_positions.get(boulder_dest)
             boulder_dest_blocked = (existing_element is not None and 
                                    isinstance(existing_element, Boulder))
             
             if (boulder_dest in boulder_walkable and not boulder_dest_blocked):
+                # Plate, glyph and barrier tiles can only change if a plate is involved
+                puzzle = self.puzzle_manager.boulder_to_puzzle.get(id(boulder))
+                touches_plate = puzzle is not None and (
+                    puzzle.is_plate(next_pos) or puzzle.is_plate(boulder_dest))
+                
                 # Push the boulder and move player to boulder's old position
                 if self.puzzle_manager.move_boulder(boulder, boulder_dest[0], boulder_dest[1], boulder_walkable):
                     # Update tile positions
-                    self.tiles[(boulder.x, boulder.y)] = TileType.BOULDER  # Boulder's new position
+                    self._set_tile((boulder.x, boulder.y), TileType.BOULDER)  # Boulder's new position
                     
                     # Update the original boulder position based on underlying tile
                     original_tile = self._get_underlying_tile_type(next_pos[0], next_pos[1])
-                    self.tiles[(next_pos[0], next_pos[1])] = original_tile
+                    self._set_tile(next_pos, original_tile)
                     
                     # Update puzzle state
-                    self._update_puzzle_tiles()
+                    if touches_plate:
+                        self._update_puzzle_tiles()
                     
                     print(f"Pushed boulder from {next_pos} to {boulder_dest}")
                     return True, next_pos  # Player moves to boulder's old position
@@ -404,16 +549,9 @@ class DungeonExplorer:
                 return False, player_pos
         else:
             # No boulder - check if position is walkable for player
-            player_walkable = self.get_walkable_positions(for_boulders=False)
-            if next_pos in player_walkable:
+            if next_pos in self.player_walkable:
                 # Check if there's a monster at the destination
-                monster_at_dest = None
-                for monster in self.monsters:
-                    if (monster.x, monster.y) == next_pos:
-                        monster_at_dest = monster
-                        break
-                
-                if monster_at_dest:
+                if next_pos in self.monster_by_pos:
                     # There's a monster - this should trigger combat, not movement
                     return False, player_pos
                 else:
@@ -427,7 +565,7 @@ class DungeonExplorer:
         """Get the underlying tile type for a position (what it should be without puzzle elements)"""
         # Check if this position has a pressure plate
         for puzzle in self.puzzle_manager.puzzles.values():
-            for plate in puzzle.elements["pressure_plates"]:
+            for plate in puzzle.pressure_plates:
                 if plate.x == x and plate.y == y:
                     return TileType.PRESSURE_PLATE_ACTIVE if plate.active else TileType.PRESSURE_PLATE
         
@@ -447,32 +585,51 @@ class DungeonExplorer:
         """Update tile types based on current puzzle states"""
         for puzzle in self.puzzle_manager.puzzles.values():
             # Update pressure plates
-            for plate in puzzle.elements["pressure_plates"]:
+            for plate in puzzle.pressure_plates:
                 if plate.active:
-                    self.tiles[(plate.x, plate.y)] = TileType.PRESSURE_PLATE_ACTIVE
+                    self._set_tile((plate.x, plate.y), TileType.PRESSURE_PLATE_ACTIVE)
                 else:
-                    self.tiles[(plate.x, plate.y)] = TileType.PRESSURE_PLATE
+                    self._set_tile((plate.x, plate.y), TileType.PRESSURE_PLATE)
             
             # Update glyphs
-            for glyph in puzzle.elements["glyphs"]:
+            for glyph in puzzle.glyphs:
                 if glyph.active:
-                    self.tiles[(glyph.x, glyph.y)] = TileType.GLYPH_ACTIVE
+                    self._set_tile((glyph.x, glyph.y), TileType.GLYPH_ACTIVE)
                 else:
-                    self.tiles[(glyph.x, glyph.y)] = TileType.GLYPH
+                    self._set_tile((glyph.x, glyph.y), TileType.GLYPH)
             
             # Update barriers
-            for barrier in puzzle.elements["barriers"]:
+            for barrier in puzzle.barriers:
                 if barrier.active:
-                    self.tiles[(barrier.x, barrier.y)] = TileType.BARRIER
+                    self._set_tile((barrier.x, barrier.y), TileType.BARRIER)
                 else:
                     # Remove barrier - make it walkable floor
-                    self.tiles[(barrier.x, barrier.y)] = TileType.FLOOR
+                    self._set_tile((barrier.x, barrier.y), TileType.FLOOR)
     
     def get_starting_position(self) -> Tuple[int, int]:
         return (0, 0)
     
     def is_revealed(self, x: int, y: int) -> bool:
-        """Check if a cell at given coordinates is revealed"""        
+        """Check if a cell at given coordinates is revealed"""
+        min_x, min_y, width, height = self.bounds
+        gx = x - min_x
+        gy = y - min_y
+        if 0 <= gx < width and 0 <= gy < height:
+            return self.revealed_grid[gy * width + gx] == 1
+        return self._compute_revealed(x, y)
+    
+    def _refresh_revealed(self, positions):
+        """Recompute revealed_grid for just the given cells."""
+        min_x, min_y, width, height = self.bounds
+        revealed_grid = self.revealed_grid
+        for x, y in positions:
+            gx = x - min_x
+            gy = y - min_y
+            if 0 <= gx < width and 0 <= gy < height:
+                revealed_grid[gy * width + gx] = self._compute_revealed(x, y)
+    
+    def _compute_revealed(self, x: int, y: int) -> bool:
+        """Work out from rooms and doors whether a cell is revealed."""
         # Check if in revealed room
         for room_id in self.revealed_rooms:
             room = self.rooms[room_id]
@@ -483,7 +640,7 @@ class DungeonExplorer:
         for door in self.doors:
             if door.x == x and door.y == y:
                 # Secret doors are never revealed this way
-                if door.type == 6 and not door.is_open:
+                if door.type == _SECRET_DOOR_TYPE and not door.is_open:
                     return False
                 # Door is visible if either connected room is revealed
                 if (door.room1_id in self.revealed_rooms or 
@@ -416,12 +416,12 @@ def main():
                                 tile_at_pos = dungeon.tiles.get(player_pos)
                                 if tile_at_pos in [TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL]:
                                     if dungeon.open_door_at_position(player_pos[0], player_pos[1]):
-                                        walkable_positions = dungeon.get_walkable_positions(for_monster=False)
+                                        walkable_positions = dungeon.player_walkable
                                 
                                 # Move monsters (existing code)
                                 occupied_tiles = {(m.x, m.y) for m in dungeon.monsters}
                                 occupied_tiles.add(player_pos)
-                                monster_walkable = dungeon.get_walkable_positions(for_monster=True)
+                                monster_walkable = dungeon.get_monster_walkable_positions()
 
                                 for monster in dungeon.monsters:
                                     if monster.room_id in dungeon.revealed_rooms:
@@ -574,7 +574,7 @@ def main():
                             if combat_manager.state == CombatState.NOT_IN_COMBAT:
                                 for dx, dy in [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)]:
                                     if dungeon.open_door_at_position(player_pos[0] + dx, player_pos[1] + dy):
-                                        walkable_positions = dungeon.get_walkable_positions(for_monster=False)
+                                        walkable_positions = dungeon.player_walkable
                                         break
 
                 # Spell menu controls
@@ -695,7 +695,7 @@ def main():
                         
                         dungeon = DungeonExplorer(dungeon_data)
                         player_pos = dungeon.get_starting_position()
-                        walkable_positions = dungeon.get_walkable_positions(for_monster=False)
+                        walkable_positions = dungeon.player_walkable
                         game_state = GameState.PLAYING
 
         # --- RENDER ---
@@ -1,5 +1,6 @@
 # game_constants.py - Enhanced with puzzle elements
-from enum import Enum
+import pygame
+from enum import Enum, IntEnum
 from typing import Dict, List
 
 # --- Configuration ---
@@ -15,45 +16,49 @@ MAX_ZOOM = 4.0
 ZOOM_STEP = 0.1
 HUD_HEIGHT = 120
 
+# Equipment screen slot order
+EQUIPMENT_SLOTS = ('weapon', 'armor', 'shield', 'light')
+
 # --- Colors ---
-COLOR_BG = (183, 172, 160)
-COLOR_VOID = (183, 172, 160)
-COLOR_FLOOR = (240, 236, 224)
-COLOR_FLOOR_GRID = (162, 160, 154)
-COLOR_WALL = (0, 0, 0)
-COLOR_WALL_SHADOW = (140, 134, 125)
-COLOR_DOOR = (197, 185, 172)
-COLOR_NOTE = (255, 255, 0)
-COLOR_PLAYER = (255, 64, 64)
-COLOR_MONSTER = (0, 150, 50)
-COLOR_COLUMN = (100, 100, 100)
-COLOR_WATER = (100, 150, 200)
-COLOR_WHITE = (255, 255, 255)
-COLOR_BLACK = (0, 0, 0)
-COLOR_HP_BAR = (220, 20, 60)
-COLOR_XP_BAR = (135, 206, 250)
-COLOR_BAR_BG = (50, 50, 50)
-COLOR_TORCH_ICON = (255, 165, 0)
-COLOR_SPELL_CURSOR = (255, 0, 255)
-COLOR_SPELL_MENU_BG = (10, 10, 40, 220)
-COLOR_INPUT_BOX_ACTIVE = (200, 200, 255)
-COLOR_INVENTORY_BG = (20, 20, 20)
-COLOR_SELECTED_ITEM = (100, 150, 100)
-COLOR_EQUIPPED_ITEM = (150, 100, 50)
-COLOR_GREEN = (100, 255, 100)
-COLOR_RED = (255, 100, 100)
+# Built as pygame.Color once so draw calls get a pre-normalized color
+COLOR_BG = pygame.Color(183, 172, 160)
+COLOR_VOID = pygame.Color(183, 172, 160)
+COLOR_FLOOR = pygame.Color(240, 236, 224)
+COLOR_FLOOR_GRID = pygame.Color(162, 160, 154)
+COLOR_WALL = pygame.Color(0, 0, 0)
+COLOR_WALL_SHADOW = pygame.Color(140, 134, 125)
+COLOR_DOOR = pygame.Color(197, 185, 172)
+COLOR_NOTE = pygame.Color(255, 255, 0)
+COLOR_PLAYER = pygame.Color(255, 64, 64)
+COLOR_MONSTER = pygame.Color(0, 150, 50)
+COLOR_COLUMN = pygame.Color(100, 100, 100)
+COLOR_WATER = pygame.Color(100, 150, 200)
+COLOR_WHITE = pygame.Color(255, 255, 255)
+COLOR_BLACK = pygame.Color(0, 0, 0)
+COLOR_HP_BAR = pygame.Color(220, 20, 60)
+COLOR_XP_BAR = pygame.Color(135, 206, 250)
+COLOR_BAR_BG = pygame.Color(50, 50, 50)
+COLOR_TORCH_ICON = pygame.Color(255, 165, 0)
+COLOR_SPELL_CURSOR = pygame.Color(255, 0, 255)
+COLOR_SPELL_MENU_BG = pygame.Color(10, 10, 40, 220)
+COLOR_INPUT_BOX_ACTIVE = pygame.Color(200, 200, 255)
+COLOR_INVENTORY_BG = pygame.Color(20, 20, 20)
+COLOR_SELECTED_ITEM = pygame.Color(100, 150, 100)
+COLOR_EQUIPPED_ITEM = pygame.Color(150, 100, 50)
+COLOR_GREEN = pygame.Color(100, 255, 100)
+COLOR_RED = pygame.Color(255, 100, 100)
 
 # Puzzle-specific colors
-COLOR_ALTAR = (255, 255, 255)
-COLOR_HOLY_LIGHT = (255, 255, 100)
-COLOR_BOULDER = (139, 69, 19)
-COLOR_PRESSURE_PLATE = (100, 100, 150)
-COLOR_PRESSURE_PLATE_ACTIVE = (150, 150, 255)
-COLOR_GLYPH = (100, 255, 100)
-COLOR_GLYPH_ACTIVE = (0, 255, 0)
-COLOR_BARRIER = (255, 0, 0)
-COLOR_CHEST = (160, 82, 45)
-COLOR_TRAP_INDICATOR = (255, 165, 0)
+COLOR_ALTAR = pygame.Color(255, 255, 255)
+COLOR_HOLY_LIGHT = pygame.Color(255, 255, 100)
+COLOR_BOULDER = pygame.Color(139, 69, 19)
+COLOR_PRESSURE_PLATE = pygame.Color(100, 100, 150)
+COLOR_PRESSURE_PLATE_ACTIVE = pygame.Color(150, 150, 255)
+COLOR_GLYPH = pygame.Color(100, 255, 100)
+COLOR_GLYPH_ACTIVE = pygame.Color(0, 255, 0)
+COLOR_BARRIER = pygame.Color(255, 0, 0)
+COLOR_CHEST = pygame.Color(160, 82, 45)
+COLOR_TRAP_INDICATOR = pygame.Color(255, 165, 0)
 
 # --- UI Icons ---
 UI_ICONS = {
@@ -76,7 +81,7 @@ UI_ICONS = {
 }
 
 # --- Game States ---
-class GameState(Enum):
+class GameState(IntEnum):
     MAIN_MENU = 0
     CHAR_CREATION = 1
     PLAYING = 10
@@ -110,6 +115,9 @@ class TileType(Enum):
     STAIRS_DOWN = 18
     CHEST = 19
 
+# Doors that are still shut: they block monsters and open when the player steps in
+CLOSED_DOOR_TILES = frozenset({TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL})
+
 # --- Puzzle Types ---
 class PuzzleType(Enum):
     BOULDER_PRESSURE_PLATE = 1
@@ -117,6 +125,16 @@ class PuzzleType(Enum):
     SWITCH_COMBINATION = 3
     RIDDLE_DOOR = 4
 
+# --- Puzzle Element Types ---
+# String-valued so they still compare equal to the plain names used elsewhere
+class ElementType(str, Enum):
+    BOULDER = "boulder"
+    PRESSURE_PLATE = "pressure_plate"
+    GLYPH = "glyph"
+    BARRIER = "barrier"
+    ALTAR = "altar"
+    CHEST = "chest"
+
 # --- Puzzle States ---
 class PuzzleState(Enum):
     INACTIVE = 0
@@ -1,7 +1,8 @@
 # game_manager.py - Complete fixed version with navigation and respawn
 import pygame
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from game_constants import *
 from dungeon_classes import DungeonExplorer
 from character_creation import run_character_creation, Player
@@ -9,7 +10,39 @@ from input_handler import InputHandler
 from combat_coordinator import CombatCoordinator
 from rendering_coordinator import RenderingCoordinator
 from player_manager import PlayerManager
-from ui_systems import organize_inventory_into_containers
+from ui_systems import (
+    organize_inventory_into_containers, get_available_items_for_slot,
+    equip_item, unequip_item
+)
+from rendering_engine import is_valid_spell_target
+from combat_system import attempt_positional_attack
+
+# Direction name -> (dx, dy); 'defend' (space) doesn't move
+_DIR_TABLE = {
+    'up': (0, -1), 'down': (0, 1),
+    'left': (-1, 0), 'right': (1, 0),
+    'defend': (0, 0)
+}
+
+# 4-way steps; doors are checked on the player's own cell first, then neighbours
+_STEP_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_DOOR_OFFSETS = ((0, 0),) + _STEP_OFFSETS
+
+# Screens that only change in response to input; redrawn only when dirty
+_STATIC_SCREENS = frozenset({
+    GameState.MAIN_MENU, GameState.INVENTORY,
+    GameState.EQUIPMENT, GameState.SPELL_MENU
+})
+
+# Frames to keep redrawing after a change so every display buffer catches up
+_REDRAW_FRAMES = 2
+
+# Event types nothing consumes once the game is running (only menus use the mouse)
+_GAMEPLAY_BLOCKED_EVENTS = [
+    pygame.MOUSEMOTION, pygame.ACTIVEEVENT,
+    pygame.WINDOWENTER, pygame.WINDOWLEAVE,
+    pygame.AUDIODEVICEADDED
+]
 
 class GameManager:
     """Manages overall game state and coordinates between systems."""
@@ -18,8 +51,10 @@ class GameManager:
         self.screen = screen
         self.game_state = GameState.MAIN_MENU
         
-        # Load dungeon data
-        self.dungeon_data = self._load_dungeon_data()
+        # Parse dungeon data in the background while the main menu is up
+        self.dungeon_data: Optional[dict] = None
+        self._loader = ThreadPoolExecutor(max_workers=1)
+        self._dungeon_data_future = self._loader.submit(self._load_dungeon_data)
         
         # Initialize subsystems
         self.input_handler = InputHandler()
@@ -34,23 +69,44 @@ class GameManager:
         self.walkable_positions = set()
         
         # UI state
+        self._redraw_frames = _REDRAW_FRAMES
         self.fullscreen = False
         self.zoom_level = DEFAULT_ZOOM
         
         # Menu/UI state
         self.inventory_selected_index = 0
-        self.equipment_selected_slot = 'weapon'
+        self.equipment_selected_slot_idx = 0
         self.equipment_selection_mode = False
         self.equipment_selection_index = 0
+        self._equipment_selection_items = []  # [None (unequip)] + items, built on entering selection
         self.current_containers = []
+        self._inventory_dirty = True  # current_containers must be rebuilt
         
         # Spell system state
         self.spell_target_pos = (0, 0)
         self.current_spell = ""
         
+        # UI screen handlers for navigation/selection callbacks
+        self._nav_handlers = {
+            'inventory': self._nav_inventory,
+            'equipment': self._nav_equipment,
+            'spell_target': self._nav_spell_target
+        }
+        self._sel_handlers = {
+            'inventory': self._select_inventory,
+            'equipment': self._select_equipment,
+            'spell': self._select_spell,
+            'spell_target': self._select_spell_target
+        }
+        
         # Initialize input handler callbacks
         self._setup_input_callbacks()
     
+    @property
+    def equipment_selected_slot(self) -> str:
+        """Name of the highlighted equipment slot."""
+        return EQUIPMENT_SLOTS[self.equipment_selected_slot_idx]
+    
     def _load_dungeon_data(self) -> dict:
         """Load dungeon data from JSON file."""
         try:
@@ -60,6 +116,13 @@ class GameManager:
             print(f"Error: '{JSON_FILE}' not found.")
             raise
     
+    def _get_dungeon_data(self) -> dict:
+        """Wait for the background load, if it hasn't finished yet."""
+        if self.dungeon_data is None:
+            self.dungeon_data = self._dungeon_data_future.result()
+            self._loader.shutdown(wait=False)
+        return self.dungeon_data
+    
     def _setup_input_callbacks(self):
         """Setup callbacks for input handler."""
         # Movement callbacks
@@ -80,13 +143,30 @@ class GameManager:
         self.input_handler.set_system_callback('zoom_out', self._zoom_out)
         self.input_handler.set_system_callback('escape', self._handle_escape)
     
+    def _mark_dirty(self):
+        """Request a redraw of static screens."""
+        self._redraw_frames = _REDRAW_FRAMES
+    
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle pygame events. Returns 'quit' if game should exit."""
+        if event.type != pygame.MOUSEMOTION:
+            self._mark_dirty()
         if self.game_state == GameState.MAIN_MENU:
             return self._handle_main_menu_event(event)
         else:
             return self.input_handler.handle_event(event, self.game_state)
     
+    def handle_events_batch(self, events: list) -> Optional[str]:
+        """Handle all events queued this frame. Returns 'quit' if game should exit."""
+        handle_event = self.handle_event
+        for event in events:
+            if event.type == pygame.QUIT:
+                return "quit"
+            # handle_event re-reads the state: a key earlier in the batch may have opened a menu
+            if handle_event(event) == "quit":
+                return "quit"
+        return None
+    
     def _handle_main_menu_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle main menu events."""
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -106,6 +186,9 @@ class GameManager:
         # Store current screen dimensions before quitting display
         screen_width, screen_height = self.screen.get_size()
         
+        # Character creation and the main menu need mouse events
+        pygame.event.set_allowed(_GAMEPLAY_BLOCKED_EVENTS)
+        
         # Quit the current display
         pygame.display.quit()
         
@@ -133,34 +216,40 @@ class GameManager:
         # Setup player and world
         self.player = created_player
         self.player_manager.setup_player(self.player)
+        self._inventory_dirty = True
         
         # Initialize dungeon
-        self.dungeon = DungeonExplorer(self.dungeon_data)
+        self.dungeon = DungeonExplorer(self._get_dungeon_data())
         self.player_pos = self.dungeon.get_starting_position()
-        self.walkable_positions = self.dungeon.get_walkable_positions(for_monster=False)
+        self.walkable_positions = self.dungeon.player_walkable
         
         # Setup rendering coordinator with game world
         self.rendering_coordinator.setup_world(self.dungeon, self.player, self.player_pos)
         
         # Change to playing state
         self.game_state = GameState.PLAYING
+        pygame.event.set_blocked(_GAMEPLAY_BLOCKED_EVENTS)
     
     def update(self, dt_seconds: float):
         """Update game systems."""
         if self.game_state == GameState.PLAYING and self.player and self.dungeon:
             # Update combat
             self.combat_coordinator.update(dt_seconds)
-            
-            # Update rendering coordinator
-            self.rendering_coordinator.update(dt_seconds, self.player_pos, self.zoom_level)
     
-    def render(self):
-        """Render current game state."""
+    def render(self) -> List[pygame.Rect]:
+        """Render current game state and return the screen areas that changed."""
+        if self.game_state in _STATIC_SCREENS:
+            if self._redraw_frames <= 0:
+                return []
+            self._redraw_frames -= 1
+        
         if self.game_state == GameState.MAIN_MENU:
             self.rendering_coordinator.render_main_menu()
         
         elif self.game_state == GameState.PLAYING:
             if self.player and self.dungeon:
+                # Viewport follows the player once per drawn frame, not per logic step
+                self.rendering_coordinator.update(self.player_pos, self.zoom_level)
                 self.rendering_coordinator.render_game(
                     self.player, self.player_pos, self.dungeon, 
                     self.combat_coordinator, self.zoom_level
@@ -184,94 +273,107 @@ class GameManager:
             self.rendering_coordinator.render_spell_targeting(
                 self.player, self.player_pos, self.current_spell, self.spell_target_pos
             )
+        
+        # The view is centred on the player, so any redraw repaints the whole screen
+        return [self.screen.get_rect()]
     
     def _handle_navigation(self, screen_type: str, direction: str):
         """Handle navigation in UI screens."""
-        if screen_type == 'inventory':
+        handler = self._nav_handlers.get(screen_type)
+        if handler:
+            handler(direction)
+    
+    def _nav_inventory(self, direction: str):
+        """Move the inventory container selection."""
+        if direction == 'up':
+            if self.current_containers:
+                self.inventory_selected_index = (self.inventory_selected_index - 1) % len(self.current_containers)
+        elif direction == 'down':
+            if self.current_containers:
+                self.inventory_selected_index = (self.inventory_selected_index + 1) % len(self.current_containers)
+    
+    def _nav_equipment(self, direction: str):
+        """Move between equipment slots, or between items in selection mode."""
+        if not self.equipment_selection_mode:
+            # Navigating equipment slots
             if direction == 'up':
-                if self.current_containers:
-                    self.inventory_selected_index = (self.inventory_selected_index - 1) % len(self.current_containers)
+                self.equipment_selected_slot_idx = (self.equipment_selected_slot_idx - 1) % len(EQUIPMENT_SLOTS)
             elif direction == 'down':
-                if self.current_containers:
-                    self.inventory_selected_index = (self.inventory_selected_index + 1) % len(self.current_containers)
-        
-        elif screen_type == 'equipment':
-            equipment_slots = ['weapon', 'armor', 'shield', 'light']
-            
-            if not self.equipment_selection_mode:
-                # Navigating equipment slots
-                if direction == 'up':
-                    current_index = equipment_slots.index(self.equipment_selected_slot)
-                    self.equipment_selected_slot = equipment_slots[(current_index - 1) % len(equipment_slots)]
-                elif direction == 'down':
-                    current_index = equipment_slots.index(self.equipment_selected_slot)
-                    self.equipment_selected_slot = equipment_slots[(current_index + 1) % len(equipment_slots)]
-            else:
-                # Navigating equipment selection
-                from ui_systems import get_available_items_for_slot
-                available_items = get_available_items_for_slot(self.player, self.equipment_selected_slot)
-                available_items.insert(0, None)  # Add unequip option
-                
-                if direction == 'up':
-                    self.equipment_selection_index = (self.equipment_selection_index - 1) % len(available_items)
-                elif direction == 'down':
-                    self.equipment_selection_index = (self.equipment_selection_index + 1) % len(available_items)
-        
-        elif screen_type == 'spell_target':
-            # Handle spell targeting movement
-            from rendering_engine import is_valid_spell_target
-            dx, dy = {
-                'up': (0, -1), 'down': (0, 1),
-                'left': (-1, 0), 'right': (1, 0)
-            }.get(direction, (0, 0))
+                self.equipment_selected_slot_idx = (self.equipment_selected_slot_idx + 1) % len(EQUIPMENT_SLOTS)
+        else:
+            # Navigating equipment selection
+            available_items = self._equipment_selection_items
+            if not available_items:
+                return
             
-            new_target = (self.spell_target_pos[0] + dx, self.spell_target_pos[1] + dy)
-            if is_valid_spell_target(self.player_pos, new_target, self.current_spell):
-                self.spell_target_pos = new_target
+            if direction == 'up':
+                self.equipment_selection_index = (self.equipment_selection_index - 1) % len(available_items)
+            elif direction == 'down':
+                self.equipment_selection_index = (self.equipment_selection_index + 1) % len(available_items)
+    
+    def _nav_spell_target(self, direction: str):
+        """Move the spell targeting cursor within range."""
+        dx, dy = _DIR_TABLE.get(direction, (0, 0))
+        
+        new_target = (self.spell_target_pos[0] + dx, self.spell_target_pos[1] + dy)
+        if is_valid_spell_target(self.player_pos, new_target, self.current_spell):
+            self.spell_target_pos = new_target
 
     def _handle_selection(self, screen_type: str, action):
         """Handle selection in UI screens."""
-        if screen_type == 'inventory':
-            if action == 'select':
-                if self.current_containers and 0 <= self.inventory_selected_index < len(self.current_containers):
-                    current_container = self.current_containers[self.inventory_selected_index]
-                    # Could implement container viewing here
-                    print(f"Selected container: {current_container.name}")
-        
-        elif screen_type == 'equipment':
-            if action == 'select':
-                if not self.equipment_selection_mode:
-                    # Enter selection mode
-                    self.equipment_selection_mode = True
-                    self.equipment_selection_index = 0
-                else:
-                    # Make selection
-                    from ui_systems import get_available_items_for_slot, equip_item, unequip_item
-                    available_items = get_available_items_for_slot(self.player, self.equipment_selected_slot)
-                    available_items.insert(0, None)  # Add unequip option
+        handler = self._sel_handlers.get(screen_type)
+        if handler:
+            handler(action)
+    
+    def _select_inventory(self, action):
+        """Select the highlighted inventory container."""
+        if action == 'select':
+            if self.current_containers and 0 <= self.inventory_selected_index < len(self.current_containers):
+                current_container = self.current_containers[self.inventory_selected_index]
+                # Could implement container viewing here
+                print(f"Selected container: {current_container.name}")
+    
+    def _select_equipment(self, action):
+        """Enter item selection for a slot, or equip the highlighted item."""
+        if action == 'select':
+            if not self.equipment_selection_mode:
+                # Enter selection mode
+                self.equipment_selection_mode = True
+                self.equipment_selection_index = 0
+                # Add unequip option ahead of the slot's items
+                self._equipment_selection_items = [None] + get_available_items_for_slot(
+                    self.player, self.equipment_selected_slot
+                )
+            else:
+                # Make selection
+                available_items = self._equipment_selection_items
+                
+                if 0 <= self.equipment_selection_index < len(available_items):
+                    selected_item = available_items[self.equipment_selection_index]
+                    
+                    self._inventory_dirty = True
+                    if selected_item is None:
+                        unequip_item(self.player, self.equipment_selected_slot)
+                        print(f"Unequipped {self.equipment_selected_slot}")
+                    else:
+                        equip_item(self.player, selected_item, self.equipment_selected_slot)
+                        print(f"Equipped {selected_item.item.name} to {self.equipment_selected_slot}")
                     
-                    if 0 <= self.equipment_selection_index < len(available_items):
-                        selected_item = available_items[self.equipment_selection_index]
-                        
-                        if selected_item is None:
-                            unequip_item(self.player, self.equipment_selected_slot)
-                            print(f"Unequipped {self.equipment_selected_slot}")
-                        else:
-                            equip_item(self.player, selected_item, self.equipment_selected_slot)
-                            print(f"Equipped {selected_item.item.name} to {self.equipment_selected_slot}")
-                        
-                        self.equipment_selection_mode = False
-        
-        elif screen_type == 'spell':
-            if isinstance(action, int):
-                # Spell selection
-                self.current_spell = "Burning Hands"  # For now, just one spell
-                self.game_state = GameState.SPELL_TARGETING
-        
-        elif screen_type == 'spell_target':
-            if action == 'cast':
-                print(f"Casting {self.current_spell} at {self.spell_target_pos}!")
-                self.game_state = GameState.PLAYING
+                    self.equipment_selection_mode = False
+                    self._equipment_selection_items = []
+    
+    def _select_spell(self, action):
+        """Pick a spell from the spell menu."""
+        if isinstance(action, int):
+            # Spell selection
+            self.current_spell = "Burning Hands"  # For now, just one spell
+            self.game_state = GameState.SPELL_TARGETING
+    
+    def _select_spell_target(self, action):
+        """Cast the current spell at the targeted cell."""
+        if action == 'cast':
+            print(f"Casting {self.current_spell} at {self.spell_target_pos}!")
+            self.game_state = GameState.PLAYING
     
     # Movement handling
     def _handle_movement(self, direction: str) -> bool:
@@ -280,15 +382,12 @@ class GameManager:
             return False
         
         # Calculate next position
-        dx, dy = {
-            'up': (0, -1), 'down': (0, 1),
-            'left': (-1, 0), 'right': (1, 0),
-            'defend': (0, 0)  # Space key for defend
-        }.get(direction, (0, 0))
+        dx, dy = _DIR_TABLE.get(direction, (0, 0))
+        in_combat = self.combat_coordinator.is_in_combat()
         
         # Handle defend action
         if direction == 'defend':
-            if self.combat_coordinator.is_in_combat():
+            if in_combat:
                 combat_ended = self.combat_coordinator.handle_defend_action(
                     self.player, self.player_pos, self.walkable_positions
                 )
@@ -302,27 +401,25 @@ class GameManager:
         
         next_pos = (self.player_pos[0] + dx, self.player_pos[1] + dy)
         
-        if self.combat_coordinator.is_in_combat():
+        if in_combat:
             return self._handle_combat_movement(next_pos)
         else:
             return self._handle_exploration_movement(next_pos)
     
     def _try_open_doors(self):
         """Try to open doors around the player."""
-        from game_constants import TileType
-        for dx, dy in [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)]:
-            if self.dungeon.open_door_at_position(self.player_pos[0] + dx, self.player_pos[1] + dy):
-                self.walkable_positions = self.dungeon.get_walkable_positions(for_monster=False)
+        px, py = self.player_pos
+        for dx, dy in _DOOR_OFFSETS:
+            if self.dungeon.open_door_at_position(px + dx, py + dy):
+                self.walkable_positions = self.dungeon.player_walkable
                 break
     
     def _handle_exploration_movement(self, next_pos: tuple) -> bool:
         """Handle movement during exploration."""
         # Check for monster at target position
-        monster_at_target = None
-        for monster in self.dungeon.monsters:
-            if (monster.x, monster.y) == next_pos and self.dungeon.is_revealed(monster.x, monster.y):
-                monster_at_target = monster
-                break
+        monster_at_target = self.dungeon.monster_by_pos.get(next_pos)
+        if monster_at_target and not self.dungeon.is_revealed(next_pos[0], next_pos[1]):
+            monster_at_target = None
         
         if monster_at_target:
             # Initiate combat
@@ -355,7 +452,6 @@ class GameManager:
             self._handle_combat_end()
         else:
             # Only update player position if they safely moved (not attacking)
-            from combat_system import attempt_positional_attack
             can_attack, target_monster = attempt_positional_attack(
                 self.player_pos, next_pos, 
                 self.combat_coordinator.get_combat_manager(), 
@@ -370,36 +466,56 @@ class GameManager:
     
     def _handle_safe_movement(self):
         """Handle effects of safe movement (doors, monster movement, etc.)."""
-        from game_constants import TileType
-        
         # Auto-open doors
-        tile_at_pos = self.dungeon.tiles.get(self.player_pos)
-        if tile_at_pos in [TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL]:
+        tile_at_pos = self.dungeon.tile_at(self.player_pos[0], self.player_pos[1])
+        if tile_at_pos in CLOSED_DOOR_TILES:
             if self.dungeon.open_door_at_position(self.player_pos[0], self.player_pos[1]):
-                self.walkable_positions = self.dungeon.get_walkable_positions(for_monster=False)
+                self.walkable_positions = self.dungeon.player_walkable
         
         # Move monsters toward player
         self._update_monster_positions()
     
     def _update_monster_positions(self):
         """Update monster positions based on player movement."""
-        occupied_tiles = {(m.x, m.y) for m in self.dungeon.monsters}
-        occupied_tiles.add(self.player_pos)
-        monster_walkable = self.dungeon.get_walkable_positions(for_monster=True)
+        monsters_by_room = self.dungeon.monsters_by_room
+        active_monsters = [m for room_id in self.dungeon.revealed_rooms
+                           for m in monsters_by_room.get(room_id, ())]
+        if not active_monsters:
+            return
+        
+        monster_walkable = self.dungeon.get_monster_walkable_positions()
+        
+        # One distance field from the player serves every monster this step
+        distances = self.dungeon.bfs_from(
+            self.player_pos, monster_walkable, ((m.x, m.y) for m in active_monsters)
+        )
 
-        for monster in self.dungeon.monsters:
-            if monster.room_id in self.dungeon.revealed_rooms:
-                dx = self.player_pos[0] - monster.x
-                dy = self.player_pos[1] - monster.y
-                
-                next_monster_pos = monster.x, monster.y
-                if abs(dx) > abs(dy):
-                    next_monster_pos = (monster.x + (1 if dx > 0 else -1), monster.y)
-                else:
-                    next_monster_pos = (monster.x, monster.y + (1 if dy > 0 else -1))
-                
-                if next_monster_pos in monster_walkable and next_monster_pos not in occupied_tiles:
-                    monster.x, monster.y = next_monster_pos
+        # Bound once for the per-monster loop; every move, in or out of combat,
+        # goes through move_monster, so the position index doubles as the occupancy check.
+        # The player's tile is never a candidate since adjacent monsters skip.
+        get_dist = distances.get
+        occupied_tiles = self.dungeon.monster_by_pos
+        move_monster = self.dungeon.move_monster
+        
+        for monster in active_monsters:
+            mx, my = monster.x, monster.y
+            current_dist = get_dist((mx, my))
+            if current_dist is None or current_dist <= 1:
+                continue  # No path to the player, or already adjacent
+            
+            # Step to the free neighbour closest to the player along the path
+            next_monster_pos = None
+            best_dist = current_dist
+            for dx, dy in _STEP_OFFSETS:
+                candidate = (mx + dx, my + dy)
+                candidate_dist = get_dist(candidate)
+                if (candidate_dist is not None and candidate_dist < best_dist and
+                        candidate not in occupied_tiles):
+                    next_monster_pos = candidate
+                    best_dist = candidate_dist
+            
+            if next_monster_pos:
+                move_monster(monster, next_monster_pos[0], next_monster_pos[1])
     
     def _handle_combat_end(self):
         """Handle combat ending."""
@@ -439,14 +555,16 @@ class GameManager:
             return
         self.game_state = GameState.INVENTORY
         self.inventory_selected_index = 0
-        self.current_containers = organize_inventory_into_containers(self.player)
+        if self._inventory_dirty:
+            self.current_containers = organize_inventory_into_containers(self.player)
+            self._inventory_dirty = False
     
     def _open_equipment(self):
         """Open equipment screen."""
         if self.combat_coordinator.is_in_combat():
             return
         self.game_state = GameState.EQUIPMENT
-        self.equipment_selected_slot = 'weapon'
+        self.equipment_selected_slot_idx = 0
         self.equipment_selection_mode = False
     
     def _open_spell_menu(self):
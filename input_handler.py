@@ -1,8 +1,13 @@
 # input_handler.py - Fixed version with proper equipment and inventory navigation
 import pygame
-from typing import Callable, Optional, Dict
+from functools import partial
+from typing import Callable, Optional, Dict, Tuple
 from game_constants import GameState
 
+# Event types checked on every event, bound once at import
+_KEYDOWN = pygame.KEYDOWN
+_VIDEORESIZE = pygame.VIDEORESIZE
+
 class InputHandler:
     """Handles all input processing and maps events to game actions."""
     
@@ -34,6 +39,37 @@ class InputHandler:
             pygame.K_MINUS: 'zoom_out',
             pygame.K_ESCAPE: 'escape'
         }
+        
+        # System keys with a registered callback; these work in every state
+        self._system_dispatch: Dict[int, Callable] = {}
+        
+        # Movement keys as parallel tuples for held-key polling
+        self._movement_key_ids = tuple(self.movement_keys)
+        self._movement_dirs = tuple(self.movement_keys.values())
+        
+        # One (state, key) -> handler table replaces the per-state if/elif chains
+        self._dispatch: Dict[Tuple[GameState, int], Callable[[], Optional[str]]] = {}
+        self._build_dispatch()
+    
+    def _build_dispatch(self):
+        """Populate the flat state/key dispatch table."""
+        dispatch = self._dispatch
+        
+        for key, direction in self.movement_keys.items():
+            dispatch[(GameState.PLAYING, key)] = partial(self._move, direction)
+            dispatch[(GameState.SPELL_TARGETING, key)] = partial(self._navigate, 'spell_target', direction)
+        for key, menu_type in self.menu_keys.items():
+            dispatch[(GameState.PLAYING, key)] = partial(self._open_menu, menu_type)
+        dispatch[(GameState.PLAYING, pygame.K_SPACE)] = self._defend
+        
+        for game_state, screen in ((GameState.INVENTORY, 'inventory'),
+                                   (GameState.EQUIPMENT, 'equipment')):
+            dispatch[(game_state, pygame.K_UP)] = partial(self._navigate, screen, 'up')
+            dispatch[(game_state, pygame.K_DOWN)] = partial(self._navigate, screen, 'down')
+            dispatch[(game_state, pygame.K_RETURN)] = partial(self._select, screen, 'select')
+        
+        dispatch[(GameState.SPELL_MENU, pygame.K_1)] = partial(self._select, 'spell', 1)
+        dispatch[(GameState.SPELL_TARGETING, pygame.K_RETURN)] = partial(self._select, 'spell_target', 'cast')
     
     def set_movement_callback(self, callback: Callable):
         """Set callback for movement actions."""
@@ -46,6 +82,9 @@ class InputHandler:
     def set_system_callback(self, system_action: str, callback: Callable):
         """Set callback for system actions."""
         self.system_callbacks[system_action] = callback
+        for key, action in self.system_keys.items():
+            if action == system_action:
+                self._system_dispatch[key] = callback
     
     def set_navigation_callback(self, callback: Callable):
         """Set callback for UI navigation."""
@@ -57,9 +96,9 @@ class InputHandler:
     
     def handle_event(self, event: pygame.event.Event, game_state: GameState) -> Optional[str]:
         """Handle a pygame event based on current game state."""
-        if event.type == pygame.KEYDOWN:
+        if event.type == _KEYDOWN:
             return self._handle_keydown(event, game_state)
-        elif event.type == pygame.VIDEORESIZE:
+        elif event.type == _VIDEORESIZE:
             return self._handle_resize(event)
         
         return None
@@ -69,90 +108,43 @@ class InputHandler:
         key = event.key
         
         # System keys work in all states
-        if key in self.system_keys:
-            action = self.system_keys[key]
-            if action in self.system_callbacks:
-                return self.system_callbacks[action]()
+        system_handler = self._system_dispatch.get(key)
+        if system_handler:
+            return system_handler()
         
         # State-specific handling
-        if game_state == GameState.PLAYING:
-            return self._handle_playing_input(key)
-        elif game_state == GameState.INVENTORY:
-            return self._handle_inventory_input(key)
-        elif game_state == GameState.EQUIPMENT:
-            return self._handle_equipment_input(key)
-        elif game_state == GameState.SPELL_MENU:
-            return self._handle_spell_menu_input(key)
-        elif game_state == GameState.SPELL_TARGETING:
-            return self._handle_spell_targeting_input(key)
-        
-        return None
+        handler = self._dispatch.get((game_state, key))
+        return handler() if handler else None
     
-    def _handle_playing_input(self, key: int) -> Optional[str]:
-        """Handle input during gameplay."""
-        # Movement
-        if key in self.movement_keys:
-            direction = self.movement_keys[key]
-            if self.movement_callback:
-                self.movement_callback(direction)
-            return None
-        
-        # Menu actions
-        if key in self.menu_keys:
-            menu_type = self.menu_keys[key]
-            if menu_type in self.menu_callbacks:
-                self.menu_callbacks[menu_type]()
-            return None
-        
-        # Space key for defend/wait/interact
-        if key == pygame.K_SPACE:
-            if self.movement_callback:
-                return self.movement_callback('defend')
-        
+    def _move(self, direction: str) -> Optional[str]:
+        """Forward a movement key during gameplay."""
+        if self.movement_callback:
+            self.movement_callback(direction)
         return None
     
-    def _handle_inventory_input(self, key: int) -> Optional[str]:
-        """Handle inventory screen input."""
-        if key == pygame.K_UP:
-            if self.navigation_callback:
-                self.navigation_callback('inventory', 'up')
-        elif key == pygame.K_DOWN:
-            if self.navigation_callback:
-                self.navigation_callback('inventory', 'down')
-        elif key == pygame.K_RETURN:
-            if self.selection_callback:
-                self.selection_callback('inventory', 'select')
+    def _defend(self) -> Optional[str]:
+        """Space key for defend/wait/interact."""
+        if self.movement_callback:
+            return self.movement_callback('defend')
         return None
     
-    def _handle_equipment_input(self, key: int) -> Optional[str]:
-        """Handle equipment screen input."""
-        if key == pygame.K_UP:
-            if self.navigation_callback:
-                self.navigation_callback('equipment', 'up')
-        elif key == pygame.K_DOWN:
-            if self.navigation_callback:
-                self.navigation_callback('equipment', 'down')
-        elif key == pygame.K_RETURN:
-            if self.selection_callback:
-                self.selection_callback('equipment', 'select')
+    def _open_menu(self, menu_type: str) -> Optional[str]:
+        """Open a menu screen from gameplay."""
+        callback = self.menu_callbacks.get(menu_type)
+        if callback:
+            callback()
         return None
     
-    def _handle_spell_menu_input(self, key: int) -> Optional[str]:
-        """Handle spell menu input."""
-        if key == pygame.K_1:
-            if self.selection_callback:
-                self.selection_callback('spell', 1)
+    def _navigate(self, screen: str, direction: str) -> Optional[str]:
+        """Forward UI navigation for a screen."""
+        if self.navigation_callback:
+            self.navigation_callback(screen, direction)
         return None
     
-    def _handle_spell_targeting_input(self, key: int) -> Optional[str]:
-        """Handle spell targeting input."""
-        if key in self.movement_keys:
-            direction = self.movement_keys[key]
-            if self.navigation_callback:
-                self.navigation_callback('spell_target', direction)
-        elif key == pygame.K_RETURN:
-            if self.selection_callback:
-                self.selection_callback('spell_target', 'cast')
+    def _select(self, screen: str, action) -> Optional[str]:
+        """Forward UI selection for a screen."""
+        if self.selection_callback:
+            self.selection_callback(screen, action)
         return None
     
     def _handle_resize(self, event: pygame.event.Event) -> Optional[str]:
@@ -161,7 +153,7 @@ class InputHandler:
     
     def get_movement_direction(self, keys_pressed) -> Optional[str]:
         """Get movement direction from currently pressed keys."""
-        for key, direction in self.movement_keys.items():
+        for key, direction in zip(self._movement_key_ids, self._movement_dirs):
             if keys_pressed[key]:
                 return direction
         return None
\ No newline at end of file
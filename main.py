@@ -1,11 +1,25 @@
 # main.py - Main entry point and game loop
+import logging
 import pygame
-import sys
 from game_manager import GameManager
 from game_constants import *
 
+# Input devices the game never reads; SDL drops these before they reach the queue
+_IGNORED_EVENTS = [
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    pygame.MULTIGESTURE, pygame.MOUSEWHEEL
+]
+
+# Game logic advances in fixed steps; long stalls are capped so it never spirals
+_FIXED_DT = 1 / 60.0
+_MAX_FRAME_TIME = 0.25
+
 def main():
     """Main entry point for the dungeon crawler game."""
+    # Game messages go to the console; library users and tests stay at WARNING
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     pygame.init()
     
     # Initialize display
@@ -13,6 +27,7 @@ def main():
     initial_height = INITIAL_VIEWPORT_HEIGHT * int(BASE_CELL_SIZE * DEFAULT_ZOOM)
     screen = pygame.display.set_mode((initial_width, initial_height + HUD_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("Dungeon Explorer")
+    pygame.event.set_blocked(_IGNORED_EVENTS)
     
     # Initialize game manager
     game_manager = GameManager(screen)
@@ -20,29 +35,24 @@ def main():
     # Main game loop
     clock = pygame.time.Clock()
     running = True
+    accumulator = 0.0
     
     try:
         while running:
-            dt = clock.tick(60)
-            dt_seconds = dt / 1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    # Let game manager handle all other events
-                    result = game_manager.handle_event(event)
-                    if result == "quit":
-                        running = False
+            # Handle all events queued this frame in one call
+            if game_manager.handle_events_batch(pygame.event.get()) == "quit":
+                running = False
             
-            # Update game state
-            game_manager.update(dt_seconds)
+            # Update game state in fixed steps
+            while accumulator >= _FIXED_DT:
+                game_manager.update(_FIXED_DT)
+                accumulator -= _FIXED_DT
             
-            # Render
-            game_manager.render()
+            # Render, then present only what was redrawn
+            pygame.display.update(game_manager.render())
             
-            pygame.display.flip()
+            # Sleep after presenting so the next frame polls fresh input
+            accumulator += min(clock.tick(60) / 1000.0, _MAX_FRAME_TIME)
     
     except KeyboardInterrupt:
         print("Game interrupted by user")
@@ -52,7 +62,6 @@ def main():
         traceback.print_exc()
     finally:
         pygame.quit()
-        sys.exit()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,65 +1,68 @@
 # monster_system.py - Monster loading and management system
 import json
+import pickle
+from bisect import bisect_left, bisect_right
 import random
+import re
 import os
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from functools import cache
+from game_constants import UI_ICONS
+
+# Snapshot of parsed templates, kept next to the monster JSON files.
+# Bump the version whenever the template classes change shape.
+_CACHE_FILENAME = "monsters.cache"
+_CACHE_VERSION = 5
+
+# Glyph for monsters whose template has no ascii_char
+_MONSTER_FALLBACK_CHAR = UI_ICONS["MONSTER"]
+
+# Attack details look like "+2 (1d4 piercing)": an optional bonus, then dice in parentheses
+_ATTACK_RE = re.compile(r'\s*([+-]?\d+)?\s*\(\s*([^)\s]+)')
+
+# Ability modifier for each stat value from 0 to 31
+_STAT_MOD_TABLE = tuple(
+    -4 if v <= 3 else -3 if v <= 5 else -2 if v <= 7 else -1 if v <= 9
+    else 0 if v <= 11 else 1 if v <= 13 else 2 if v <= 15 else 3 if v <= 17 else 4
+    for v in range(32)
+)
 
 def get_stat_modifier(stat_value: int) -> int:
     """Calculate ability modifier from stat value"""
-    if stat_value <= 3:
-        return -4
-    elif stat_value <= 5:
-        return -3
-    elif stat_value <= 7:
-        return -2
-    elif stat_value <= 9:
-        return -1
-    elif stat_value <= 11:
-        return 0
-    elif stat_value <= 13:
-        return +1
-    elif stat_value <= 15:
-        return +2
-    elif stat_value <= 17:
-        return +3
-    else:
-        return +4
+    if 0 <= stat_value < 32:
+        return _STAT_MOD_TABLE[stat_value]
+    return -4 if stat_value < 0 else 4
 
-@dataclass
+@dataclass(slots=True)
 class MonsterAttack:
     name: str
     details: str  # e.g., "+2 (1d4 piercing)"
     count: int = 1
+    attack_bonus: int = field(init=False)
+    damage_dice: str = field(init=False)
+    
+    def __post_init__(self):
+        # Parse the details string once; combat reads these on every swing.
+        # Details without dice (e.g. "paralysis") fall back to +0 / 1d4.
+        match = _ATTACK_RE.match(self.details)
+        self.attack_bonus = int(match.group(1)) if match and match.group(1) else 0
+        self.damage_dice = match.group(2) if match else "1d4"
     
     def get_attack_bonus(self) -> int:
-        """Extract attack bonus from details string"""
-        try:
-            if '+' in self.details:
-                bonus_str = self.details.split('(')[0].strip()
-                return int(bonus_str.replace('+', ''))
-            return 0
-        except:
-            return 0
+        """Attack bonus parsed from the details string"""
+        return self.attack_bonus
     
     def get_damage_dice(self) -> str:
-        """Extract damage dice from details string"""
-        try:
-            if '(' in self.details and ')' in self.details:
-                damage_part = self.details.split('(')[1].split(')')[0]
-                # Extract just the dice part (e.g., "1d4" from "1d4 piercing")
-                damage_dice = damage_part.split()[0]
-                return damage_dice
-            return "1d4"
-        except:
-            return "1d4"
+        """Damage dice parsed from the details string"""
+        return self.damage_dice
 
-@dataclass
+@dataclass(slots=True)
 class MonsterSpecialAbility:
     name: str
     description: str
 
-@dataclass
+@dataclass(slots=True)
 class MonsterTemplate:
     name: str
     description: str
@@ -74,6 +77,18 @@ class MonsterTemplate:
     level: int
     special_abilities: List[MonsterSpecialAbility] = field(default_factory=list)
     dark_adapted: bool = False
+    con_mod: int = field(init=False)
+    _primary_attack: Optional[MonsterAttack] = field(init=False, repr=False, compare=False)
+    _primary_attack_bonus: int = field(init=False, repr=False, compare=False)
+    _primary_damage_dice: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Template stats and attacks never change, so these are fixed
+        self.con_mod = self.get_stat_modifier('constitution')
+        primary = self.attacks[0] if self.attacks else None
+        self._primary_attack = primary
+        self._primary_attack_bonus = primary.attack_bonus if primary else 0
+        self._primary_damage_dice = primary.damage_dice if primary else "1d4"
     
     def get_stat_modifier(self, stat_name: str) -> int:
         """Get the modifier for a given stat"""
@@ -82,13 +97,12 @@ class MonsterTemplate:
     
     def get_primary_attack(self) -> Optional[MonsterAttack]:
         """Get the first/primary attack"""
-        return self.attacks[0] if self.attacks else None
+        return self._primary_attack
     
     def roll_hp(self) -> int:
         """Roll HP based on level and constitution (basic formula)"""
-        con_mod = self.get_stat_modifier('constitution')
         # Simple formula: base HP + (level * constitution modifier)
-        rolled_hp = max(1, self.hp + (self.level * con_mod))
+        rolled_hp = max(1, self.hp + (self.level * self.con_mod))
         return rolled_hp
 
 class MonsterDatabase:
@@ -96,6 +110,14 @@ class MonsterDatabase:
         self.monsters_directory = monsters_directory
         self.monster_templates: Dict[str, MonsterTemplate] = {}
         self.load_all_monsters()
+        self._build_level_index()
+    
+    def _build_level_index(self):
+        """Sort templates by level so a level range maps to one contiguous slice"""
+        self._templates_by_level: Tuple[MonsterTemplate, ...] = tuple(sorted(
+            self.monster_templates.values(), key=lambda monster: monster.level
+        ))
+        self._levels: Tuple[int, ...] = tuple(monster.level for monster in self._templates_by_level)
     
     def load_all_monsters(self):
         """Load all monster JSON files from the monsters directory"""
@@ -104,22 +126,69 @@ class MonsterDatabase:
             self._create_example_monsters()
             return
         
-        json_files = [f for f in os.listdir(self.monsters_directory) if f.endswith('.json')]
+        # scandir hands back directory entries whose stat info the OS may already have
+        with os.scandir(self.monsters_directory) as it:
+            json_entries = [entry for entry in it if entry.name.endswith('.json')]
         
-        for filename in json_files:
-            filepath = os.path.join(self.monsters_directory, filename)
+        # Reuse the parsed snapshot when no monster file has changed
+        signature = self._cache_signature(json_entries)
+        if self._load_cache(signature):
+            return
+        
+        loaded_names = []
+        failed = False
+        for entry in json_entries:
             try:
-                with open(filepath, 'r') as f:
-                    monster_data = json.load(f)
-                    monster = self._parse_monster_json(monster_data)
-                    self.monster_templates[monster.name] = monster
-                    print(f"Loaded monster: {monster.name}")
+                with open(entry.path, 'rb') as f:
+                    monster_data = json.loads(f.read())
+                monster = self._parse_monster_json(monster_data)
+                self.monster_templates[monster.name] = monster
+                loaded_names.append(monster.name)
             except Exception as e:
-                print(f"Error loading monster file {filename}: {e}")
+                print(f"Error loading monster file {entry.name}: {e}")
+                failed = True
+        
+        if loaded_names:
+            print("\n".join(f"Loaded monster: {name}" for name in loaded_names))
         
         if not self.monster_templates:
             print("No monsters loaded, creating example monsters.")
             self._create_example_monsters()
+        elif not failed:
+            # A snapshot would hide a broken file's error on later starts
+            self._save_cache(signature)
+    
+    def _cache_path(self) -> str:
+        """Path of the parsed monster snapshot"""
+        return os.path.join(self.monsters_directory, _CACHE_FILENAME)
+    
+    def _cache_signature(self, json_entries: List[os.DirEntry]) -> Tuple:
+        """Identify the current set of monster files by name and modification time"""
+        return (_CACHE_VERSION,) + tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns) for entry in json_entries
+        ))
+    
+    def _load_cache(self, signature: Tuple) -> bool:
+        """Load templates from the snapshot if it matches the monster files"""
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                cached_signature, templates = pickle.load(f)
+        except Exception:
+            return False  # Missing, stale layout or unreadable; rebuild from JSON
+        
+        if cached_signature != signature or not templates:
+            return False
+        
+        self.monster_templates = templates
+        return True
+    
+    def _save_cache(self, signature: Tuple):
+        """Write the parsed templates out as a snapshot for the next start"""
+        try:
+            with open(self._cache_path(), 'wb') as f:
+                pickle.dump((signature, self.monster_templates), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Could not write monster cache: {e}")
     
     def _parse_monster_json(self, data: Dict[str, Any]) -> MonsterTemplate:
         """Parse a monster JSON into a MonsterTemplate"""
@@ -274,12 +343,15 @@ class MonsterDatabase:
             filename = f"{monster_data['name'].lower().replace(' ', '_')}.json"
             filepath = os.path.join(self.monsters_directory, filename)
             
-            with open(filepath, 'w') as f:
-                json.dump(monster_data, f, indent=2)
-            
-            # Also load into memory
+            # Build the template straight from the in-memory dict
             monster = self._parse_monster_json(monster_data)
             self.monster_templates[monster.name] = monster
+            
+            # Write via a temp file so an interrupted run never leaves a truncated JSON
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(monster_data, f, indent=2)
+            os.replace(tmp_path, filepath)
             print(f"Created example monster: {monster.name}")
     
     def get_monster(self, name: str) -> Optional[MonsterTemplate]:
@@ -288,17 +360,15 @@ class MonsterDatabase:
     
     def get_random_monster(self, level_range: Tuple[int, int] = (1, 3)) -> Optional[MonsterTemplate]:
         """Get a random monster within the given level range"""
-        suitable_monsters = [
-            monster for monster in self.monster_templates.values() 
-            if level_range[0] <= monster.level <= level_range[1]
-        ]
+        start = bisect_left(self._levels, level_range[0])
+        end = bisect_right(self._levels, level_range[1])
         
-        if suitable_monsters:
-            return random.choice(suitable_monsters)
+        if start < end:
+            return self._templates_by_level[start + random.randrange(end - start)]
         
         # Fallback to any monster if none in range
-        if self.monster_templates:
-            return random.choice(list(self.monster_templates.values()))
+        if self._templates_by_level:
+            return random.choice(self._templates_by_level)
         
         return None
     
@@ -306,7 +376,7 @@ class MonsterDatabase:
         """Get a list of all available monster names"""
         return list(self.monster_templates.keys())
 
-@dataclass
+@dataclass(slots=True)
 class MonsterInstance:
     """An actual monster instance in the game"""
     template: MonsterTemplate
@@ -317,10 +387,13 @@ class MonsterInstance:
     max_hp: int
     name: str = ""
     fled: bool = False
+    # Glyph drawn for this monster, copied from the template once at creation
+    render_char: str = field(default="", init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.name:
             self.name = self.template.name
+        self.render_char = self.template.ascii_char or _MONSTER_FALLBACK_CHAR
     
     @classmethod
     def from_template(cls, template: MonsterTemplate, x: int, y: int, room_id: int) -> 'MonsterInstance':
@@ -337,17 +410,11 @@ class MonsterInstance:
     
     def get_attack_bonus(self) -> int:
         """Get the attack bonus for this monster's primary attack"""
-        primary_attack = self.template.get_primary_attack()
-        if primary_attack:
-            return primary_attack.get_attack_bonus()
-        return 0
+        return self.template._primary_attack_bonus
     
     def get_damage_dice(self) -> str:
         """Get the damage dice for this monster's primary attack"""
-        primary_attack = self.template.get_primary_attack()
-        if primary_attack:
-            return primary_attack.get_damage_dice()
-        return "1d4"
+        return self.template._primary_damage_dice
     
     def is_alive(self) -> bool:
         """Check if the monster is still alive"""
@@ -358,15 +425,10 @@ class MonsterInstance:
         self.current_hp -= damage
         return self.current_hp <= 0
 
-# Global monster database instance
-monster_db = None
-
+@cache
 def get_monster_database() -> MonsterDatabase:
-    """Get the global monster database, creating it if necessary"""
-    global monster_db
-    if monster_db is None:
-        monster_db = MonsterDatabase()
-    return monster_db
+    """Get the global monster database, creating it on first use"""
+    return MonsterDatabase()
 
 def spawn_random_monster(x: int, y: int, room_id: int, level_range: Tuple[int, int] = (1, 3)) -> Optional[MonsterInstance]:
     """Spawn a random monster at the given location"""
@@ -1,16 +1,36 @@
 # player_manager.py - Player character management
+import logging
+import random
+from bisect import bisect_right
+from itertools import accumulate
 from character_creation import Player
 from ui_systems import calculate_armor_class, get_stat_modifier
 
+_log = logging.getLogger(__name__)
+
+# Hit die rolled per level by class; Thief and Wizard use d4
+_HP_DICE = {"Fighter": 8, "Priest": 6}
+
+# Total XP to climb from level 1 to each level (index = level - 1) under the
+# level * 100 rule; larger gains step past the table one level at a time
+_XP_TABLE_MAX_LEVEL = 100
+_XP_CUMULATIVE = tuple(accumulate(
+    (level * 100 for level in range(2, _XP_TABLE_MAX_LEVEL + 1)), initial=0
+))
+
 class PlayerManager:
     """Manages player character data and actions."""
     
     def __init__(self):
         self.player: Player = None
+        self._slots_dirty = True  # gear_slots_used must be recounted
+        self._combat_cache = {}  # Derived bonuses keyed by the stats they depend on
     
     def setup_player(self, player: Player):
         """Setup a newly created player character."""
         self.player = player
+        self._slots_dirty = True
+        self._combat_cache.clear()
         
         # Calculate AC based on equipment
         player.ac = calculate_armor_class(player)
@@ -24,29 +44,40 @@ class PlayerManager:
         # Calculate actual gear slots used from inventory
         self._calculate_gear_slots_used()
         
-        print(f"Player setup complete:")
-        print(f"  Name: {player.name}")
-        print(f"  Class: {player.character_class}")
-        print(f"  Items: {len(player.inventory)}")
-        print(f"  Gold: {player.gold}")
-        print(f"  Gear slots: {player.gear_slots_used}/{player.max_gear_slots}")
-        print(f"  AC: {player.ac}")
-        print(f"  HP: {player.hp}/{player.max_hp}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info(
+                "Player setup complete:\n"
+                f"  Name: {player.name}\n"
+                f"  Class: {player.character_class}\n"
+                f"  Items: {len(player.inventory)}\n"
+                f"  Gold: {player.gold}\n"
+                f"  Gear slots: {player.gear_slots_used}/{player.max_gear_slots}\n"
+                f"  AC: {player.ac}\n"
+                f"  HP: {player.hp}/{player.max_hp}"
+            )
+    
+    def mark_inventory_dirty(self):
+        """Flag the inventory as changed so gear slots are recounted on next use."""
+        self._slots_dirty = True
     
     def _calculate_gear_slots_used(self):
         """Calculate how many gear slots are currently used."""
-        self.player.gear_slots_used = 0
-        
+        # The total only changes when the inventory does
+        if not self._slots_dirty:
+            return
+        self._slots_dirty = False
+        # Every GearItem carries gear_slots and quantity_per_slot, so no reflection is needed
+        slots_used = 0
         for inv_item in self.player.inventory:
-            item_slots = getattr(inv_item.item, 'gear_slots', 1)
-            
-            if hasattr(inv_item.item, 'quantity_per_slot') and inv_item.item.quantity_per_slot > 1:
+            item = inv_item.item
+            per_slot = item.quantity_per_slot
+            if per_slot > 1:
                 # Items that can stack (like arrows, rations)
-                slots_needed = (inv_item.quantity + inv_item.item.quantity_per_slot - 1) // inv_item.item.quantity_per_slot
-                self.player.gear_slots_used += slots_needed * item_slots
+                slots_used += item.gear_slots * ((inv_item.quantity + per_slot - 1) // per_slot)
             else:
                 # Regular items
-                self.player.gear_slots_used += item_slots * inv_item.quantity
+                slots_used += item.gear_slots * inv_item.quantity
+        self.player.gear_slots_used = slots_used
     
     def update_player_hp(self, new_hp: int):
         """Update player HP and handle death."""
@@ -57,7 +88,7 @@ class PlayerManager:
     
     def _handle_player_death(self):
         """Handle player character death."""
-        print(f"{self.player.name} has fallen!")
+        _log.info("%s has fallen!", self.player.name)
         # Death handling logic could go here
     
     def heal_player(self, amount: int) -> int:
@@ -68,62 +99,81 @@ class PlayerManager:
     
     def get_attack_bonus(self) -> int:
         """Calculate player's attack bonus."""
-        attack_bonus = get_stat_modifier(self.player.strength)
-        
-        # Class-specific bonuses
-        if self.player.character_class == "Fighter":
-            attack_bonus += self.player.level // 2
-        
+        player = self.player
+        key = ('atk', player.strength, player.level, player.character_class)
+        attack_bonus = self._combat_cache.get(key)
+        if attack_bonus is None:
+            attack_bonus = get_stat_modifier(player.strength)
+            
+            # Class-specific bonuses
+            if player.character_class == "Fighter":
+                attack_bonus += player.level // 2
+            
+            self._combat_cache[key] = attack_bonus
         return attack_bonus
     
     def get_damage_bonus(self) -> int:
         """Calculate player's damage bonus."""
-        return get_stat_modifier(self.player.strength)
+        key = ('dmg', self.player.strength)
+        damage_bonus = self._combat_cache.get(key)
+        if damage_bonus is None:
+            damage_bonus = self._combat_cache[key] = get_stat_modifier(self.player.strength)
+        return damage_bonus
     
     def can_carry_more(self, additional_slots: int = 1) -> bool:
         """Check if player can carry additional gear slots."""
+        self._calculate_gear_slots_used()
         return (self.player.gear_slots_used + additional_slots) <= self.player.max_gear_slots
     
     def add_experience(self, xp_amount: int):
         """Add experience and handle level ups."""
-        self.player.xp += xp_amount
+        player = self.player
+        player.xp += xp_amount
+        if player.xp < player.xp_to_next_level:
+            return
+        
+        # The first level uses the player's stored requirement; the rest follow the table
+        spare_xp = player.xp - player.xp_to_next_level
+        target_level = player.level + 1
+        if target_level < _XP_TABLE_MAX_LEVEL:
+            total = _XP_CUMULATIVE[target_level - 1] + spare_xp
+            target_level = bisect_right(_XP_CUMULATIVE, total)
+            spare_xp = total - _XP_CUMULATIVE[target_level - 1]
         
-        while self.player.xp >= self.player.xp_to_next_level:
-            self._level_up()
+        while spare_xp >= self._calculate_xp_for_level(target_level + 1):
+            spare_xp -= self._calculate_xp_for_level(target_level + 1)
+            target_level += 1
+        
+        self._level_up(target_level - player.level, spare_xp)
     
-    def _level_up(self):
-        """Handle player leveling up."""
-        self.player.xp -= self.player.xp_to_next_level
-        self.player.level += 1
+    def _level_up(self, levels: int, remaining_xp: int):
+        """Apply one or more level ups at once."""
+        player = self.player
+        player.xp = remaining_xp
+        player.level += levels
+        self._combat_cache.clear()  # Old-level entries can never match again
         
         # Increase XP requirement for next level
-        self.player.xp_to_next_level = self._calculate_xp_for_level(self.player.level + 1)
+        player.xp_to_next_level = self._calculate_xp_for_level(player.level + 1)
         
-        # Roll for HP increase
-        hp_increase = self._roll_hp_increase()
-        self.player.max_hp += hp_increase
-        self.player.hp += hp_increase  # Full heal on level up
+        # Roll for HP increase, one hit die per level gained
+        hp_increase = sum(self._roll_hp_increase() for _ in range(levels))
+        player.max_hp += hp_increase
+        player.hp += hp_increase  # Full heal on level up
         
-        print(f"{self.player.name} reached level {self.player.level}!")
-        print(f"HP increased by {hp_increase}!")
+        _log.info("%s reached level %d!", player.name, player.level)
+        _log.info("HP increased by %d!", hp_increase)
     
-    def _calculate_xp_for_level(self, level: int) -> int:
+    @staticmethod
+    def _calculate_xp_for_level(level: int) -> int:
         """Calculate XP requirement for a given level."""
         # Simple progression: level * 100
         return level * 100
     
     def _roll_hp_increase(self) -> int:
         """Roll HP increase for level up."""
-        import random
-        
         con_modifier = get_stat_modifier(self.player.constitution)
-        
-        if self.player.character_class == "Fighter":
-            hp_gain = random.randint(1, 8) + con_modifier
-        elif self.player.character_class == "Priest":
-            hp_gain = random.randint(1, 6) + con_modifier
-        else:  # Thief and Wizard
-            hp_gain = random.randint(1, 4) + con_modifier
+        hp_gain = random.randint(1, _HP_DICE.get(self.player.character_class, 4)) + con_modifier
         
         return max(1, hp_gain)  # Minimum 1 HP gain
     
@@ -149,4 +199,4 @@ class PlayerManager:
                 'wisdom': self.player.wisdom,
                 'charisma': self.player.charisma
             }
-        }
\ No newline at end of file
+        }
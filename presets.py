@@ -3,12 +3,23 @@ from character_creation import Player
 from gear_selection import WEAPONS, ARMOR, GENERAL_GEAR, InventoryItem
 import time
 
+# Gear definitions are shared and never mutated; look them up once at import.
+# InventoryItems stay per-call since each player owns and changes its own.
+_BASTARD_SWORD = WEAPONS["Bastard sword"]
+_CHAINMAIL = ARMOR["Chainmail"]
+_SHIELD = ARMOR["Shield"]
+_RATIONS = GENERAL_GEAR["Rations (3)"]
+_SHORTSWORD = WEAPONS["Shortsword"]
+_SHORTBOW = WEAPONS["Shortbow"]
+_ARROWS = GENERAL_GEAR["Arrows (20)"]
+_LEATHER_ARMOR = ARMOR["Leather armor"]
+
 def create_preset_fighter() -> Player:
     """Creates a preset Dwarf Fighter character."""
-    bastard_sword = InventoryItem(item=WEAPONS["Bastard sword"], quantity=1)
-    chainmail = InventoryItem(item=ARMOR["Chainmail"], quantity=1)
-    shield = InventoryItem(item=ARMOR["Shield"], quantity=1)
-    rations = InventoryItem(item=GENERAL_GEAR["Rations (3)"], quantity=2)
+    bastard_sword = InventoryItem(item=_BASTARD_SWORD, quantity=1)
+    chainmail = InventoryItem(item=_CHAINMAIL, quantity=1)
+    shield = InventoryItem(item=_SHIELD, quantity=1)
+    rations = InventoryItem(item=_RATIONS, quantity=2)
 
     fighter = Player(
         name="Grorim",
@@ -45,10 +56,10 @@ def create_preset_fighter() -> Player:
 
 def create_preset_thief() -> Player:
     """Creates a preset Halfling Thief character."""
-    shortsword = InventoryItem(item=WEAPONS["Shortsword"], quantity=1)
-    shortbow = InventoryItem(item=WEAPONS["Shortbow"], quantity=1)
-    arrows = InventoryItem(item=GENERAL_GEAR["Arrows (20)"], quantity=1)
-    leather_armor = InventoryItem(item=ARMOR["Leather armor"], quantity=1)
+    shortsword = InventoryItem(item=_SHORTSWORD, quantity=1)
+    shortbow = InventoryItem(item=_SHORTBOW, quantity=1)
+    arrows = InventoryItem(item=_ARROWS, quantity=1)
+    leather_armor = InventoryItem(item=_LEATHER_ARMOR, quantity=1)
     
     thief = Player(
         name="Pippin",
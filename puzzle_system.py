@@ -1,58 +1,76 @@
 # puzzle_system.py - Interactive puzzle mechanics
+import logging
 import random
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
-from game_constants import TileType, PuzzleType, PuzzleState
+from game_constants import TileType, PuzzleType, PuzzleState, ElementType
 
-@dataclass
+_log = logging.getLogger(__name__)
+
+# Puzzle position sets hold (x << 20) + y ints rather than (x, y) tuples;
+# unique for any |y| < 2**19, far beyond dungeon extents
+_KEY_SHIFT = 20
+
+# Element type -> PuzzleRoom.elements list it is stored in
+_ELEMENT_LISTS = {
+    ElementType.BOULDER: "boulders",
+    ElementType.PRESSURE_PLATE: "pressure_plates",
+    ElementType.GLYPH: "glyphs",
+    ElementType.BARRIER: "barriers",
+    ElementType.ALTAR: "altars",
+    ElementType.CHEST: "chests",
+}
+
+@dataclass(slots=True)
 class PuzzleElement:
     """Base class for puzzle elements"""
     x: int
     y: int
-    element_type: str
+    element_type: ElementType
     active: bool = False
     interactable: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class Boulder(PuzzleElement):
     """Moveable boulder for pressure plate puzzles"""
     def __init__(self, x: int, y: int):
-        super().__init__(x, y, "boulder", False, True)
+        PuzzleElement.__init__(self, x, y, ElementType.BOULDER, False, True)
 
-@dataclass
+@dataclass(slots=True)
 class PressurePlate(PuzzleElement):
     """Pressure plate that activates when boulder is placed on it"""
     def __init__(self, x: int, y: int):
-        super().__init__(x, y, "pressure_plate", False, False)
+        PuzzleElement.__init__(self, x, y, ElementType.PRESSURE_PLATE, False, False)
 
-@dataclass
+@dataclass(slots=True)
 class Glyph(PuzzleElement):
     """Magical glyph that glows when puzzle conditions are met"""
     def __init__(self, x: int, y: int):
-        super().__init__(x, y, "glyph", False, False)
+        PuzzleElement.__init__(self, x, y, ElementType.GLYPH, False, False)
 
-@dataclass
+@dataclass(slots=True)
 class Barrier(PuzzleElement):
     """Magical barrier that blocks passage until dissolved"""
     def __init__(self, x: int, y: int):
-        super().__init__(x, y, "barrier", True, False)  # Starts active (blocking)
+        PuzzleElement.__init__(self, x, y, ElementType.BARRIER, True, False)  # Starts active (blocking)
 
-@dataclass
+@dataclass(slots=True)
 class Altar(PuzzleElement):
     """Stone altar with holy light"""
     def __init__(self, x: int, y: int):
-        super().__init__(x, y, "altar", True, True)
+        PuzzleElement.__init__(self, x, y, ElementType.ALTAR, True, True)
 
-@dataclass
+@dataclass(slots=True)
 class Chest(PuzzleElement):
     """Treasure chest, potentially trapped"""
     trapped: bool = False
     opened: bool = False
     
     def __init__(self, x: int, y: int, trapped: bool = False):
-        super().__init__(x, y, "chest", False, True)
+        PuzzleElement.__init__(self, x, y, ElementType.CHEST, False, True)
         self.trapped = trapped
+        self.opened = False  # Slots carry no class-level default to fall back on
 
 @dataclass
 class PuzzleRoom:
@@ -62,33 +80,68 @@ class PuzzleRoom:
     state: PuzzleState
     elements: Dict[str, List[PuzzleElement]] = field(default_factory=dict)
     solution_positions: List[Tuple[int, int]] = field(default_factory=list)
+    # Pressure plates never move, so their position keys are collected once
+    plate_keys: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+    # Boulder position keys, kept current by PuzzleManager.move_boulder
+    boulder_keys: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    plates_by_key: Dict[int, PuzzleElement] = field(default_factory=dict, init=False, repr=False, compare=False)
+    covered_plates: int = field(default=0, init=False, repr=False, compare=False)
+    # Direct references to the lists in elements, so hot paths skip the dict lookup
+    boulders: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    pressure_plates: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    glyphs: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    barriers: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    altars: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
+    chests: List[PuzzleElement] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if not self.elements:
+        elements = self.elements
+        if elements:
+            self.boulders = elements.setdefault("boulders", [])
+            self.pressure_plates = elements.setdefault("pressure_plates", [])
+            self.glyphs = elements.setdefault("glyphs", [])
+            self.barriers = elements.setdefault("barriers", [])
+            self.altars = elements.setdefault("altars", [])
+            self.chests = elements.setdefault("chests", [])
+        else:
             self.elements = {
-                "boulders": [],
-                "pressure_plates": [],
-                "glyphs": [],
-                "barriers": [],
-                "altars": [],
-                "chests": []
+                "boulders": self.boulders,
+                "pressure_plates": self.pressure_plates,
+                "glyphs": self.glyphs,
+                "barriers": self.barriers,
+                "altars": self.altars,
+                "chests": self.chests
             }
+        self._refresh_plate_positions()
+        self._refresh_boulder_positions()
+    
+    def _refresh_plate_positions(self):
+        """Rebuild the cached pressure plate key index"""
+        self.plates_by_key = {(p.x << _KEY_SHIFT) + p.y: p for p in self.pressure_plates}
+        self.plate_keys = frozenset(self.plates_by_key)
+        self.covered_plates = len(self.plate_keys & self.boulder_keys)
+    
+    def _refresh_boulder_positions(self):
+        """Rebuild the boulder key set from the boulders themselves"""
+        self.boulder_keys = {(b.x << _KEY_SHIFT) + b.y for b in self.boulders}
+        self.covered_plates = len(self.plate_keys & self.boulder_keys)
     
     def add_element(self, element: PuzzleElement):
         """Add an element to the puzzle"""
         element_type = element.element_type
-        if element_type == "boulder":
-            self.elements["boulders"].append(element)
-        elif element_type == "pressure_plate":
-            self.elements["pressure_plates"].append(element)
-        elif element_type == "glyph":
-            self.elements["glyphs"].append(element)
-        elif element_type == "barrier":
-            self.elements["barriers"].append(element)
-        elif element_type == "altar":
-            self.elements["altars"].append(element)
-        elif element_type == "chest":
-            self.elements["chests"].append(element)
+        list_name = _ELEMENT_LISTS.get(element_type)
+        if list_name is None:
+            return
+        self.elements[list_name].append(element)
+        
+        # Boulders and plates also feed the solution indexes
+        if element_type is ElementType.BOULDER:
+            key = (element.x << _KEY_SHIFT) + element.y
+            if key not in self.boulder_keys:
+                self.boulder_keys.add(key)
+                self.covered_plates += key in self.plate_keys
+        elif element_type is ElementType.PRESSURE_PLATE:
+            self._refresh_plate_positions()
     
     def check_solution(self) -> bool:
         """Check if the puzzle is solved"""
@@ -98,11 +151,10 @@ class PuzzleRoom:
     
     def _check_boulder_puzzle(self) -> bool:
         """Check if all pressure plates have boulders on them"""
-        boulder_positions = {(b.x, b.y) for b in self.elements["boulders"]}
-        plate_positions = {(p.x, p.y) for p in self.elements["pressure_plates"]}
+        self._refresh_boulder_positions()
         
         # All pressure plates must have boulders on them
-        return plate_positions.issubset(boulder_positions)
+        return self.plate_keys.issubset(self.boulder_keys)
     
     def update_state(self):
         """Update puzzle state based on current conditions"""
@@ -114,30 +166,68 @@ class PuzzleRoom:
         else:
             self._update_partial_solution()
     
+    def boulder_moved(self, old_pos: Tuple[int, int], new_pos: Tuple[int, int]):
+        """Update puzzle state for a single boulder move without rescanning"""
+        boulder_keys = self.boulder_keys
+        plate_keys = self.plate_keys
+        old_key = (old_pos[0] << _KEY_SHIFT) + old_pos[1]
+        new_key = (new_pos[0] << _KEY_SHIFT) + new_pos[1]
+        
+        # Keep a running count of covered plates instead of re-testing them all
+        if old_key in boulder_keys:
+            boulder_keys.remove(old_key)
+            self.covered_plates -= old_key in plate_keys
+        if new_key not in boulder_keys:
+            boulder_keys.add(new_key)
+            self.covered_plates += new_key in plate_keys
+        
+        # Off-plate moves leave every plate, and so the solution, as it was
+        if old_key not in plate_keys and new_key not in plate_keys:
+            return
+        
+        if self.state == PuzzleState.SOLVED:
+            return  # Already solved
+        
+        if (self.puzzle_type == PuzzleType.BOULDER_PRESSURE_PLATE and
+                self.covered_plates == len(plate_keys)):
+            self._solve_puzzle()
+            return
+        
+        # Only the plates the boulder left and landed on can change
+        for key in (old_key, new_key):
+            plate = self.plates_by_key.get(key)
+            if plate:
+                plate.active = key in boulder_keys
+    
+    def is_plate(self, pos: Tuple[int, int]) -> bool:
+        """Check whether a pressure plate sits at the given position"""
+        return (pos[0] << _KEY_SHIFT) + pos[1] in self.plate_keys
+    
     def _solve_puzzle(self):
         """Execute puzzle solution effects"""
-        print(f"Puzzle in room {self.room_id} solved!")
+        _log.info("Puzzle in room %s solved!", self.room_id)
         self.state = PuzzleState.SOLVED
         
         # Activate glyphs
-        for glyph in self.elements["glyphs"]:
+        for glyph in self.glyphs:
             glyph.active = True
         
         # Deactivate barriers
-        for barrier in self.elements["barriers"]:
+        for barrier in self.barriers:
             barrier.active = False
         
         # Activate pressure plates
-        for plate in self.elements["pressure_plates"]:
+        for plate in self.pressure_plates:
             plate.active = True
     
     def _update_partial_solution(self):
         """Update elements for partial solutions"""
         # Update pressure plate states
-        boulder_positions = {(b.x, b.y) for b in self.elements["boulders"]}
+        self._refresh_boulder_positions()
+        boulder_keys = self.boulder_keys
         
-        for plate in self.elements["pressure_plates"]:
-            plate.active = (plate.x, plate.y) in boulder_positions
+        for plate in self.pressure_plates:
+            plate.active = (plate.x << _KEY_SHIFT) + plate.y in boulder_keys
 
 class PuzzleManager:
     """Manages all puzzles in the dungeon"""
@@ -145,11 +235,20 @@ class PuzzleManager:
     def __init__(self):
         self.puzzles: Dict[int, PuzzleRoom] = {}  # room_id -> PuzzleRoom
         self.element_positions: Dict[Tuple[int, int], PuzzleElement] = {}
+        self.boulder_to_puzzle: Dict[int, PuzzleRoom] = {}  # id(boulder) -> owning puzzle
+        # Boulders are absent on purpose: the movement system pushes them
+        self._interaction_handlers = {
+            ElementType.ALTAR: self._interact_with_altar,
+            ElementType.CHEST: self._interact_with_chest,
+        }
     
     def add_puzzle(self, puzzle: PuzzleRoom):
         """Add a puzzle to the manager"""
         self.puzzles[puzzle.room_id] = puzzle
         
+        for boulder in puzzle.boulders:
+            self.boulder_to_puzzle[id(boulder)] = puzzle
+        
         # Index all elements by position
         for element_list in puzzle.elements.values():
             for element in element_list:
@@ -169,8 +268,8 @@ class PuzzleManager:
             return False
         
         # Check if there's already a boulder at the new position
-        existing_element = self.get_element_at_position(new_x, new_y)
-        if existing_element and existing_element.element_type == "boulder":
+        existing_element = self.element_positions.get(new_pos)
+        if existing_element and existing_element.element_type is ElementType.BOULDER:
             return False
         
         # Move the boulder
@@ -179,11 +278,10 @@ class PuzzleManager:
         boulder.y = new_y
         self.element_positions[new_pos] = boulder
         
-        # Update puzzle state
-        for puzzle in self.puzzles.values():
-            if boulder in puzzle.elements["boulders"]:
-                puzzle.update_state()
-                break
+        # Update puzzle state from the single moved boulder
+        puzzle = self.boulder_to_puzzle.get(id(boulder))
+        if puzzle:
+            puzzle.boulder_moved(old_pos, new_pos)
         
         return True
     
@@ -193,26 +291,21 @@ class PuzzleManager:
         if not element or not element.interactable:
             return False
         
-        if element.element_type == "altar":
-            return self._interact_with_altar(element)
-        elif element.element_type == "chest":
-            return self._interact_with_chest(element, player)
-        elif element.element_type == "boulder":
-            # Boulder interaction is handled by movement system
+        handler = self._interaction_handlers.get(element.element_type)
+        if handler is None:
             return False
-        
-        return False
+        return handler(element, player)
     
-    def _interact_with_altar(self, altar: Altar) -> bool:
+    def _interact_with_altar(self, altar: Altar, player) -> bool:
         """Handle altar interaction"""
-        print("You touch the stone altar. It radiates warmth and holy energy.")
-        print("Ancient runes along its edge glow faintly, as if responding to your presence.")
+        _log.info("You touch the stone altar. It radiates warmth and holy energy.")
+        _log.info("Ancient runes along its edge glow faintly, as if responding to your presence.")
         return True
     
     def _interact_with_chest(self, chest: Chest, player) -> bool:
         """Handle chest interaction"""
         if chest.opened:
-            print("The chest is already empty.")
+            _log.info("The chest is already empty.")
             return True
         
         if chest.trapped:
@@ -221,13 +314,13 @@ class PuzzleManager:
             player_skill = 10 + random.randint(1, 20)  # Basic skill check
             
             if player_skill >= trap_difficulty:
-                print("You carefully disarm the trap mechanism.")
+                _log.info("You carefully disarm the trap mechanism.")
             else:
                 damage = random.randint(1, 4)
                 player.hp -= damage
-                print(f"The trap triggers! You take {damage} damage from poison needles.")
+                _log.info("The trap triggers! You take %d damage from poison needles.", damage)
                 if player.hp <= 0:
-                    print("The trap proves deadly!")
+                    _log.info("The trap proves deadly!")
                     return True
         
         # Open chest and give rewards
@@ -240,23 +333,28 @@ class PuzzleManager:
         # Simple reward system
         gold_reward = random.randint(10, 50)
         player.gold += gold_reward
-        print(f"You find {gold_reward} gold pieces in the chest!")
+        _log.info("You find %d gold pieces in the chest!", gold_reward)
         
         # Small chance for magic item
-        if random.randint(1, 100) <= 20:
-            print("You also discover a glowing potion!")
+        if random.random() < 0.20:
+            _log.info("You also discover a glowing potion!")
             # Could add actual potion to inventory here
 
 def generate_boulder_puzzle(room, room_cells: List[Tuple[int, int]]) -> PuzzleRoom:
     """Generate a boulder and pressure plate puzzle for a room"""
     puzzle = PuzzleRoom(room.id, PuzzleType.BOULDER_PRESSURE_PLATE, PuzzleState.ACTIVE)
     
-    # Filter out cells near the edges for puzzle elements
+    # Keep puzzle elements two cells in from the edges; rooms are rectangles,
+    # so the interior is just a smaller range (row-major, like Room.get_cells)
     interior_cells = [
-        (x, y) for x, y in room_cells 
-        if (x > room.x + 1 and x < room.x + room.width - 2 and
-            y > room.y + 1 and y < room.y + room.height - 2)
+        (x, y)
+        for y in range(room.y + 2, room.y + room.height - 2)
+        for x in range(room.x + 2, room.x + room.width - 2)
     ]
+    if len(room_cells) != room.width * room.height:
+        # Partial cell list: only keep interior cells that were actually offered
+        offered = set(room_cells)
+        interior_cells = [cell for cell in interior_cells if cell in offered]
     
     if len(interior_cells) < 8:  # Need space for altar + 3 boulders + 3 plates + chest + barrier
         return puzzle
@@ -267,14 +365,21 @@ def generate_boulder_puzzle(room, room_cells: List[Tuple[int, int]]) -> PuzzleRo
     altar = Altar(center_x, center_y)
     puzzle.add_element(altar)
     
-    # Remove center from available positions
-    available_cells = [cell for cell in interior_cells if cell != (center_x, center_y)]
+    # Remove center from available positions; it appears at most once, so a
+    # single C-level remove beats rebuilding the list
+    available_cells = interior_cells
+    try:
+        available_cells.remove((center_x, center_y))
+    except ValueError:
+        pass
     
     if len(available_cells) < 7:
         return puzzle
     
+    # At most 9 cells are used, so draw just those rather than shuffling them all
+    available_cells = random.sample(available_cells, min(9, len(available_cells)))
+    
     # Randomly place 3 pressure plates
-    random.shuffle(available_cells)
     pressure_plate_positions = available_cells[:3]
     
     for x, y in pressure_plate_positions:
@@ -302,11 +407,11 @@ def generate_boulder_puzzle(room, room_cells: List[Tuple[int, int]]) -> PuzzleRo
     if len(available_cells) > 8:
         chest_pos = available_cells[8]
         # 30% chance for trapped chest
-        is_trapped = random.randint(1, 100) <= 30
+        is_trapped = random.random() < 0.30
         chest = Chest(chest_pos[0], chest_pos[1], is_trapped)
         puzzle.add_element(chest)
     
-    print(f"Generated boulder puzzle for room {room.id}")
+    _log.info("Generated boulder puzzle for room %s", room.id)
     return puzzle
 
 def should_generate_puzzle(room) -> bool:
@@ -317,4 +422,4 @@ def should_generate_puzzle(room) -> bool:
         return False
     
     # 20% chance for eligible rooms
-    return random.randint(1, 100) <= 20
\ No newline at end of file
+    return random.random() < 0.20
\ No newline at end of file
@@ -1,5 +1,7 @@
 # rendering_coordinator.py - Rendering pipeline coordination
 import pygame
+from functools import lru_cache
+from itertools import compress, repeat
 from typing import Optional, List
 from game_constants import *
 from rendering_engine import *
@@ -7,9 +9,14 @@ from ui_systems import *
 from dungeon_classes import DungeonExplorer
 from character_creation import Player
 from combat_coordinator import CombatCoordinator
-from combat_effects import draw_sprite_with_flash
+from combat_effects import get_sprite_surface
 from combat_system import draw_combat_ui, draw_health_bars
 
+@lru_cache(maxsize=16)
+def _load_font(size: int) -> pygame.font.Font:
+    """Load the game font at a pixel size; least recently used sizes are dropped."""
+    return pygame.font.Font(FONT_FILE, size)
+
 class RenderingCoordinator:
     """Coordinates all rendering operations and manages the rendering pipeline."""
     
@@ -28,6 +35,8 @@ class RenderingCoordinator:
         self.cell_size = 0
         self.player_font = None
         self.spell_cursor_font = None
+        self._zoom_level = None  # zoom the fonts and cell size were last computed for
+        self._tile_surfaces = {}  # TileType -> pre-drawn tile at the current cell size
         
         # Game world references
         self.dungeon: Optional[DungeonExplorer] = None
@@ -36,20 +45,29 @@ class RenderingCoordinator:
         
         # UI state for main menu
         self.main_menu_button_rect = None
+        self._main_menu_cache: Optional[pygame.Surface] = None
+        self._viewport_surface: Optional[pygame.Surface] = None
+        # Tiles, terrain and walls as last drawn, reused while the view and world hold still
+        self._world_layer: Optional[pygame.Surface] = None
+        self._world_layer_key = None
+        self._combat_instructions: Optional[pygame.Surface] = None  # Pre-composed banner
+        self._coord_pos = None  # Player position the coordinate overlay was rendered for
+        self._coord_surf: Optional[pygame.Surface] = None
     
     def _setup_fonts(self):
         """Initialize all fonts used for rendering."""
-        self.hud_font_large = pygame.font.Font(FONT_FILE, 28)
-        self.hud_font_medium = pygame.font.Font(FONT_FILE, 20)
-        self.hud_font_small = pygame.font.Font(FONT_FILE, 14)
-        self.coords_font = pygame.font.Font(FONT_FILE, 16)
-        self.timer_font = pygame.font.Font(FONT_FILE, 22)
-        self.spell_menu_font = pygame.font.Font(FONT_FILE, 20)
+        self.hud_font_large = _load_font(28)
+        self.hud_font_medium = _load_font(20)
+        self.hud_font_small = _load_font(14)
+        self.coords_font = _load_font(16)
+        self.timer_font = _load_font(22)
+        self.spell_menu_font = _load_font(20)
     
     def update_screen(self, screen: pygame.Surface):
         """Update screen reference when resolution changes."""
         self.screen = screen
         self.screen_width, self.screen_height = screen.get_size()
+        self._main_menu_cache = None
     
     def setup_world(self, dungeon: DungeonExplorer, player: Player, player_pos: tuple):
         """Setup world references for rendering."""
@@ -57,14 +75,17 @@ class RenderingCoordinator:
         self.player = player
         self.player_pos = player_pos
     
-    def update(self, dt_seconds: float, player_pos: tuple, zoom_level: float):
+    def update(self, player_pos: tuple, zoom_level: float):
         """Update rendering state."""
         self.player_pos = player_pos
         
-        # Update rendering calculations based on zoom
-        self.cell_size = int(BASE_CELL_SIZE * zoom_level)
-        self.player_font = pygame.font.Font(FONT_FILE, max(8, int(BASE_FONT_SIZE * zoom_level)))
-        self.spell_cursor_font = pygame.font.Font(FONT_FILE, self.cell_size)
+        # Update rendering calculations based on zoom; fonts only change with it
+        if zoom_level != self._zoom_level:
+            self._zoom_level = zoom_level
+            self.cell_size = int(BASE_CELL_SIZE * zoom_level)
+            self.player_font = _load_font(max(8, int(BASE_FONT_SIZE * zoom_level)))
+            self.spell_cursor_font = _load_font(self.cell_size)
+            self._tile_surfaces = get_tile_surfaces(self.cell_size)
         
         # Calculate viewport dimensions
         game_area_height = self.screen_height - HUD_HEIGHT
@@ -72,12 +93,46 @@ class RenderingCoordinator:
         self.viewport_height_cells = game_area_height // self.cell_size
         
         # Calculate viewport position (centered on player)
+        prev_x, prev_y = self.viewport_x, self.viewport_y
         self.viewport_x = player_pos[0] - self.viewport_width_cells // 2
         self.viewport_y = player_pos[1] - self.viewport_height_cells // 2
+        
+        # Tiles for every type are pre-drawn on zoom change; monster glyphs are
+        # rendered on first sight, so walking one cell warms the next edge's ones
+        step_x = self.viewport_x - prev_x
+        step_y = self.viewport_y - prev_y
+        if abs(step_x) + abs(step_y) == 1 and self.dungeon is not None:
+            self._warm_edge_sprites(step_x, step_y)
+    
+    def _warm_edge_sprites(self, step_x: int, step_y: int):
+        """Render glyphs for monsters one step beyond the edge the camera is moving toward."""
+        dungeon = self.dungeon
+        vx, vy = self.viewport_x, self.viewport_y
+        # _render_world draws two cells past the viewport, so the next cells start there
+        max_x = vx + self.viewport_width_cells + 2
+        max_y = vy + self.viewport_height_cells + 2
+        if step_x:
+            column = max_x if step_x > 0 else vx - 1
+            cells = [(column, y) for y in range(vy, max_y)]
+        else:
+            row = max_y if step_y > 0 else vy - 1
+            cells = [(x, row) for x in range(vx, max_x)]
+        
+        lookup = dungeon.monster_by_pos.get
+        for x, y in cells:
+            monster = lookup((x, y))
+            if monster is not None and dungeon.is_revealed(x, y):
+                get_sprite_surface(self.player_font, monster.render_char, COLOR_MONSTER)
     
     def render_main_menu(self):
         """Render the main menu."""
-        self.main_menu_button_rect = draw_main_menu(self.screen, self.hud_font_large, self.hud_font_medium)
+        # The menu is static, so draw it once per screen size and blit after that
+        if self._main_menu_cache is None or self._main_menu_cache.get_size() != self.screen.get_size():
+            self._main_menu_cache = pygame.Surface(self.screen.get_size())
+            self.main_menu_button_rect = draw_main_menu(
+                self._main_menu_cache, self.hud_font_large, self.hud_font_medium
+            )
+        self.screen.blit(self._main_menu_cache, (0, 0))
     
     def get_main_menu_button_rect(self):
         """Get the main menu button rect for click detection."""
@@ -86,26 +141,37 @@ class RenderingCoordinator:
     def render_game(self, player: Player, player_pos: tuple, dungeon: DungeonExplorer, 
                    combat_coordinator: CombatCoordinator, zoom_level: float):
         """Render the main game view."""
+        # Combat state and effects are fixed for the frame; look them up once
+        in_combat = combat_coordinator.is_in_combat()
+        effects_manager = combat_coordinator.get_effects_manager()
+        
         self.screen.fill(COLOR_BG)
         
-        # Create viewport surface
-        game_area_height = self.screen_height - HUD_HEIGHT
-        viewport_surface = pygame.Surface((self.screen_width, game_area_height))
-        viewport_surface.fill(COLOR_BG)
+        # Reuse the viewport surface, in display format, until the window resizes
+        viewport_size = (self.screen_width, self.screen_height - HUD_HEIGHT)
+        viewport_surface = self._viewport_surface
+        if viewport_surface is None or viewport_surface.get_size() != viewport_size:
+            viewport_surface = self._viewport_surface = pygame.Surface(viewport_size).convert()
+            self._world_layer = viewport_surface.copy()
+            self._world_layer_key = None
         
-        # Render world
-        self._render_world(viewport_surface, dungeon)
+        # Render world, only when the camera, zoom or dungeon has changed
+        world_key = (self.viewport_x, self.viewport_y, self.cell_size, dungeon, dungeon.world_version)
+        if world_key != self._world_layer_key:
+            self._world_layer.fill(COLOR_BG)
+            self._render_world(self._world_layer, dungeon)
+            self._world_layer_key = world_key
+        viewport_surface.blit(self._world_layer, (0, 0))
         
         # Render entities
-        self._render_monsters(viewport_surface, dungeon, combat_coordinator.get_effects_manager())
-        self._render_player(viewport_surface, player_pos, combat_coordinator.get_effects_manager())
+        self._render_entities(viewport_surface, dungeon, player_pos, effects_manager)
         
         # Render combat UI
-        if combat_coordinator.is_in_combat():
+        if in_combat:
             self._render_combat_elements(viewport_surface, combat_coordinator.get_combat_manager())
         
         # Render effects
-        combat_coordinator.get_effects_manager().draw_floating_texts(
+        effects_manager.draw_floating_texts(
             viewport_surface, self.viewport_x, self.viewport_y, self.cell_size
         )
         
@@ -113,31 +179,28 @@ class RenderingCoordinator:
         self.screen.blit(viewport_surface, (0, 0))
         
         # Render screen effects
-        combat_coordinator.get_effects_manager().draw_screen_flash(self.screen)
+        effects_manager.draw_screen_flash(self.screen)
         
         # Render UI overlays
         self._render_ui_overlays(player)
         
         # Render combat instructions if in combat
-        if combat_coordinator.is_in_combat():
+        if in_combat:
             self._render_combat_instructions()
     
     def render_inventory(self, player: Player, containers: List, selected_index: int):
         """Render inventory screen."""
         draw_inventory_screen(self.screen, player, selected_index, 
-                            self.hud_font_medium, self.hud_font_small)
+                            self.hud_font_medium, self.hud_font_small, containers)
     
     def render_equipment(self, player: Player, selected_slot: str, 
                         selection_mode: bool, selection_index: int):
         """Render equipment screen."""
+        draw_equipment_screen(self.screen, player, selected_slot, 
+                            self.hud_font_medium, self.hud_font_small)
         if selection_mode:
-            draw_equipment_screen(self.screen, player, selected_slot, 
-                                self.hud_font_medium, self.hud_font_small)
             show_equipment_selection(self.screen, player, selected_slot, selection_index, 
                                    self.hud_font_medium, self.hud_font_small)
-        else:
-            draw_equipment_screen(self.screen, player, selected_slot, 
-                                self.hud_font_medium, self.hud_font_small)
     
     def render_spell_menu(self, player: Player):
         """Render spell menu."""
@@ -154,55 +217,101 @@ class RenderingCoordinator:
     
     def _render_world(self, surface: pygame.Surface, dungeon: DungeonExplorer):
         """Render the dungeon world (tiles, walls, terrain)."""
-        # Draw tiles
-        for screen_cell_y in range(self.viewport_height_cells + 2):
-            for screen_cell_x in range(self.viewport_width_cells + 2):
-                world_x = self.viewport_x + screen_cell_x
-                world_y = self.viewport_y + screen_cell_y
-                
-                tile_type = dungeon.tiles.get((world_x, world_y), TileType.VOID)
-                
-                # Check visibility
-                if dungeon.is_revealed(world_x, world_y):
-                    draw_tile(surface, tile_type, screen_cell_x, screen_cell_y, self.cell_size)
+        # Collect pre-drawn tiles and hand them to SDL in a single blits() call
+        cell_size = self.cell_size
+        vx, vy = self.viewport_x, self.viewport_y
+        blit_sequence = []
+        
+        # Revealed cells all lie inside the dungeon bounds, so clip the window
+        # to them and read each row as one slice of the flat tile grid
+        min_x, min_y, width, height = dungeon.bounds
+        tile_grid = dungeon.tile_grid
+        revealed_grid = dungeon.revealed_grid
+        x_start = max(vx, min_x)
+        x_end = min(vx + self.viewport_width_cells + 2, min_x + width)
+        y_start = max(vy, min_y)
+        y_end = min(vy + self.viewport_height_cells + 2, min_y + height)
+        
+        # Surfaces and column offsets are fixed for the frame, so each row is
+        # filtered by its revealed flags and paired up entirely in C iterators
+        surface_for = self._tile_surfaces.__getitem__
+        extend = blit_sequence.extend
+        lefts = range((x_start - vx) * cell_size, (x_end - vx) * cell_size, cell_size)
+        for world_y in range(y_start, y_end):
+            top = (world_y - vy) * cell_size
+            row_start = (world_y - min_y) * width - min_x
+            row = tile_grid[row_start + x_start:row_start + x_end]
+            revealed_row = revealed_grid[row_start + x_start:row_start + x_end]
+            extend(zip(
+                map(surface_for, compress(row, revealed_row)),
+                zip(compress(lefts, revealed_row), repeat(top))
+            ))
+        surface.blits(blit_sequence, False)
         
         # Draw terrain features
-        draw_terrain_features(surface, dungeon, self.viewport_x, self.viewport_y, self.cell_size)
+        draw_terrain_features(surface, dungeon, vx, vy, cell_size)
         
         # Draw walls
-        draw_boundary_walls(surface, dungeon, self.viewport_x, self.viewport_y, 
-                          self.cell_size, self.viewport_width_cells, self.viewport_height_cells)
-    
-    def _render_monsters(self, surface: pygame.Surface, dungeon: DungeonExplorer, effects_manager):
-        """Render all monsters with effects."""
-        for monster in dungeon.monsters:
-            if dungeon.is_revealed(monster.x, monster.y):
-                monster_screen_x = (monster.x - self.viewport_x) * self.cell_size + (self.cell_size // 2)
-                monster_screen_y = (monster.y - self.viewport_y) * self.cell_size + (self.cell_size // 2)
+        draw_boundary_walls(surface, dungeon, vx, vy, 
+                          cell_size, self.viewport_width_cells, self.viewport_height_cells)
+    
+    def _render_entities(self, surface: pygame.Surface, dungeon: DungeonExplorer, 
+                         player_pos: tuple, effects_manager):
+        """Render all monsters, then the player, with effects in one batch."""
+        # Same cell window _render_world draws, including the partial edge cells
+        vx, vy = self.viewport_x, self.viewport_y
+        max_x = vx + self.viewport_width_cells + 2
+        max_y = vy + self.viewport_height_cells + 2
+        cell_size = self.cell_size
+        half_cell = cell_size // 2
+        player_font = self.player_font
+        is_revealed = dungeon.is_revealed
+        should_flash = effects_manager.should_flash_sprite
+        
+        # Crowded levels look up the window's cells in the position index;
+        # otherwise scanning the short monster list is cheaper
+        monster_by_pos = dungeon.monster_by_pos
+        if len(monster_by_pos) > (max_x - vx) * (max_y - vy):
+            lookup = monster_by_pos.get
+            visible = [
+                monster
+                for my in range(vy, max_y)
+                for mx in range(vx, max_x)
+                if (monster := lookup((mx, my))) is not None
+            ]
+        else:
+            visible = [
+                monster for monster in dungeon.monsters
+                if vx <= monster.x < max_x and vy <= monster.y < max_y
+            ]
+        
+        # Collect cached glyphs, as draw_sprite_with_flash would draw them, for one blits() call
+        blit_sequence = []
+        for monster in visible:
+            mx, my = monster.x, monster.y
+            if is_revealed(mx, my):
+                monster_screen_x = (mx - vx) * cell_size + half_cell
+                monster_screen_y = (my - vy) * cell_size + half_cell
                 
-                # Get monster character
-                if hasattr(monster, 'template') and hasattr(monster.template, 'ascii_char'):
-                    monster_char = monster.template.ascii_char
-                else:
-                    monster_char = UI_ICONS["MONSTER"]
+                # MonsterInstance resolves its glyph at creation
+                monster_char = monster.render_char
                 
-                # Draw monster with flash effects
-                draw_sprite_with_flash(
-                    surface, monster_char, self.player_font,
-                    (monster_screen_x, monster_screen_y), COLOR_MONSTER,
-                    effects_manager, monster.x, monster.y
+                # Hit flash: alternate between white and the normal colour
+                color = COLOR_WHITE if should_flash(mx, my) else COLOR_MONSTER
+                sprite_surf = get_sprite_surface(player_font, monster_char, color)
+                blit_sequence.append(
+                    (sprite_surf, sprite_surf.get_rect(center=(monster_screen_x, monster_screen_y)))
                 )
-    
-    def _render_player(self, surface: pygame.Surface, player_pos: tuple, effects_manager):
-        """Render the player character with effects."""
-        player_screen_x = (self.viewport_width_cells // 2) * self.cell_size + (self.cell_size // 2)
-        player_screen_y = (self.viewport_height_cells // 2) * self.cell_size + (self.cell_size // 2)
         
-        draw_sprite_with_flash(
-            surface, '@', self.player_font,
-            (player_screen_x, player_screen_y), COLOR_PLAYER,
-            effects_manager, player_pos[0], player_pos[1]
+        # The player goes last so it stays on top, as when drawn separately
+        px, py = player_pos
+        color = COLOR_WHITE if should_flash(px, py) else COLOR_PLAYER
+        sprite_surf = get_sprite_surface(player_font, '@', color)
+        blit_sequence.append(
+            (sprite_surf, sprite_surf.get_rect(center=((px - vx) * cell_size + half_cell,
+                                                       (py - vy) * cell_size + half_cell)))
         )
+        surface.blits(blit_sequence, False)
     
     def _render_combat_elements(self, surface: pygame.Surface, combat_manager):
         """Render combat-specific UI elements."""
@@ -214,10 +323,12 @@ class RenderingCoordinator:
     
     def _render_ui_overlays(self, player: Player):
         """Render UI overlays (coordinates, timer, HUD)."""
-        # Coordinates
-        coord_text = f"({self.player_pos[0]}, {self.player_pos[1]})"
-        coord_surf = self.coords_font.render(coord_text, True, COLOR_WALL)
-        self.screen.blit(coord_surf, (10, 10))
+        # Coordinates, re-rendered only when the player has moved
+        if self.player_pos != self._coord_pos:
+            self._coord_pos = self.player_pos
+            coord_text = f"({self.player_pos[0]}, {self.player_pos[1]})"
+            self._coord_surf = self.coords_font.render(coord_text, True, COLOR_WALL)
+        self.screen.blit(self._coord_surf, (10, 10))
         
         # Timer
         draw_timer_box(self.screen, player, self.timer_font)
@@ -227,12 +338,21 @@ class RenderingCoordinator:
     
     def _render_combat_instructions(self):
         """Render combat instruction text."""
-        instruction_text = "Move into enemy to attack • SPACE to defend/wait"
-        inst_surf = self.hud_font_small.render(instruction_text, True, COLOR_WHITE)
-        inst_rect = inst_surf.get_rect(centerx=self.screen_width//2, 
-                                     bottom=self.screen_height - HUD_HEIGHT - 10)
-        
-        # Background for visibility
-        bg_rect = inst_rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), bg_rect)
-        self.screen.blit(inst_surf, inst_rect)
\ No newline at end of file
+        # The banner never changes, so compose it once and only reposition it on resize
+        if self._combat_instructions is None:
+            instruction_text = "Move into enemy to attack • SPACE to defend/wait"
+            inst_surf = self.hud_font_small.render(instruction_text, True, COLOR_WHITE)
+            
+            # Translucent background for visibility; draw.rect on the screen
+            # would have dropped the alpha and painted it solid
+            bg_rect = inst_surf.get_rect().inflate(20, 10)
+            banner = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+            banner.fill((0, 0, 0, 150))
+            banner.blit(inst_surf, inst_surf.get_rect(center=banner.get_rect().center))
+            self._combat_instructions = banner
+        
+        banner = self._combat_instructions
+        inst_rect = banner.get_rect().inflate(-20, -10)
+        inst_rect.centerx = self.screen_width // 2
+        inst_rect.bottom = self.screen_height - HUD_HEIGHT - 10
+        self.screen.blit(banner, inst_rect.inflate(20, 10))
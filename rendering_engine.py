@@ -1,6 +1,6 @@
 # rendering_engine.py - Complete enhanced version with puzzle elements
 import pygame
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from game_constants import *
 from dungeon_classes import DungeonExplorer
 
@@ -44,6 +44,12 @@ def draw_spell_range_indicator(surface: pygame.Surface, player_pos: Tuple[int, i
         surface.blit(range_surface, range_rect)
 
 # --- Enhanced Tile Drawing Functions ---
+# Tile groups that share a drawing branch, built once at import
+_FLOOR_TILES = frozenset({TileType.FLOOR, TileType.DOOR_OPEN})
+_STAIRS_TILES = frozenset({TileType.STAIRS_HORIZONTAL, TileType.STAIRS_VERTICAL})
+_PRESSURE_PLATE_TILES = frozenset({TileType.PRESSURE_PLATE, TileType.PRESSURE_PLATE_ACTIVE})
+_GLYPH_TILES = frozenset({TileType.GLYPH, TileType.GLYPH_ACTIVE})
+
 def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell_size: int):
     left = x * cell_size
     top = y * cell_size
@@ -53,12 +59,12 @@ def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell
     if tile_type == TileType.VOID:
         pygame.draw.rect(surface, COLOR_VOID, (left, top, cell_size, cell_size))
     
-    elif tile_type == TileType.FLOOR or tile_type == TileType.DOOR_OPEN:
+    elif tile_type in _FLOOR_TILES:
         # Draw cream floor for floor, open doors, and passages
         pygame.draw.rect(surface, COLOR_FLOOR, (left, top, cell_size, cell_size))
         draw_floor_grid(surface, left, top, cell_size)
     
-    elif tile_type in [TileType.DOOR_HORIZONTAL, TileType.DOOR_VERTICAL]:
+    elif tile_type in CLOSED_DOOR_TILES:
         # Draw floor base
         pygame.draw.rect(surface, COLOR_FLOOR, (left, top, cell_size, cell_size))
         draw_floor_grid(surface, left, top, cell_size)
@@ -80,7 +86,7 @@ def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell
         # Draw the black outline
         pygame.draw.rect(surface, COLOR_WALL, door_rect, width=outline_thickness)
 
-    elif tile_type in [TileType.STAIRS_HORIZONTAL, TileType.STAIRS_VERTICAL]:
+    elif tile_type in _STAIRS_TILES:
         # Draw floor base
         pygame.draw.rect(surface, COLOR_FLOOR, (left, top, cell_size, cell_size))
         draw_floor_grid(surface, left, top, cell_size)
@@ -145,7 +151,7 @@ def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell
         pygame.draw.rect(surface, COLOR_BOULDER, boulder_rect)
         pygame.draw.rect(surface, COLOR_WALL, boulder_rect, 2)
     
-    elif tile_type in [TileType.PRESSURE_PLATE, TileType.PRESSURE_PLATE_ACTIVE]:
+    elif tile_type in _PRESSURE_PLATE_TILES:
         # Draw floor base
         pygame.draw.rect(surface, COLOR_FLOOR, (left, top, cell_size, cell_size))
         draw_floor_grid(surface, left, top, cell_size)
@@ -156,7 +162,7 @@ def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell
         pygame.draw.circle(surface, color, (center_x, center_y), plate_radius)
         pygame.draw.circle(surface, COLOR_WALL, (center_x, center_y), plate_radius, 2)
     
-    elif tile_type in [TileType.GLYPH, TileType.GLYPH_ACTIVE]:
+    elif tile_type in _GLYPH_TILES:
         # Draw floor base
         pygame.draw.rect(surface, COLOR_FLOOR, (left, top, cell_size, cell_size))
         draw_floor_grid(surface, left, top, cell_size)
@@ -232,6 +238,16 @@ def draw_tile(surface: pygame.Surface, tile_type: TileType, x: int, y: int, cell
         handle_size = max(2, cell_size // 16)
         pygame.draw.circle(surface, COLOR_WALL, (center_x, center_y), handle_size)
 
+# element_type -> (symbol, inactive color, active color); None means not drawn
+_PUZZLE_ELEMENT_GLYPHS = {
+    ElementType.ALTAR: (UI_ICONS["ALTAR"], COLOR_ALTAR, COLOR_ALTAR),
+    ElementType.BOULDER: (UI_ICONS["BOULDER"], COLOR_BOULDER, COLOR_BOULDER),
+    ElementType.PRESSURE_PLATE: (UI_ICONS["PRESSURE_PLATE"], COLOR_PRESSURE_PLATE, COLOR_PRESSURE_PLATE_ACTIVE),
+    ElementType.GLYPH: (UI_ICONS["GLYPH"], COLOR_GLYPH, COLOR_GLYPH_ACTIVE),
+    ElementType.BARRIER: (UI_ICONS["BARRIER"], None, COLOR_BARRIER),
+    ElementType.CHEST: (UI_ICONS["CHEST"], COLOR_CHEST, COLOR_CHEST),
+}
+
 def draw_puzzle_overlays(surface: pygame.Surface, dungeon: DungeonExplorer, viewport_x: int, viewport_y: int, 
                         cell_size: int, font: pygame.font.Font):
     """Draw puzzle-specific overlays like ASCII symbols"""
@@ -254,35 +270,41 @@ def draw_puzzle_overlays(surface: pygame.Surface, dungeon: DungeonExplorer, view
                     screen_y < -cell_size or screen_y > surface.get_height() + cell_size):
                     continue
                 
-                # Get appropriate symbol and color
-                symbol = ""
-                color = COLOR_WHITE
-                
-                if element.element_type == "altar":
-                    symbol = UI_ICONS["ALTAR"]
-                    color = COLOR_ALTAR
-                elif element.element_type == "boulder":
-                    symbol = UI_ICONS["BOULDER"]
-                    color = COLOR_BOULDER
-                elif element.element_type == "pressure_plate":
-                    symbol = UI_ICONS["PRESSURE_PLATE"]
-                    color = COLOR_PRESSURE_PLATE_ACTIVE if element.active else COLOR_PRESSURE_PLATE
-                elif element.element_type == "glyph":
-                    symbol = UI_ICONS["GLYPH"]
-                    color = COLOR_GLYPH_ACTIVE if element.active else COLOR_GLYPH
-                elif element.element_type == "barrier" and element.active:
-                    symbol = UI_ICONS["BARRIER"]
-                    color = COLOR_BARRIER
-                elif element.element_type == "chest":
-                    symbol = UI_ICONS["CHEST"]
-                    color = COLOR_CHEST
+                glyph = _PUZZLE_ELEMENT_GLYPHS.get(element.element_type)
+                if glyph is None:
+                    continue
+                symbol, color, active_color = glyph
+                if element.active:
+                    color = active_color
                 
-                if symbol:
+                if color is not None:
                     # Render the symbol
                     symbol_surf = font.render(symbol, True, color)
                     symbol_rect = symbol_surf.get_rect(center=(screen_x, screen_y))
                     surface.blit(symbol_surf, symbol_rect)
 
+# Tiles pre-drawn per (tile_type, cell_size). Each is one pixel wider and taller
+# than the cell to keep the grid line draw_tile puts on the next cell's edge;
+# the colour key (used by no tile) leaves untouched pixels transparent
+_TILE_COLORKEY = (1, 2, 3)
+_tile_surfaces = {}
+
+def get_tile_surface(tile_type: TileType, cell_size: int) -> pygame.Surface:
+    """Get a tile drawn once at cell_size, ready to blit at the cell's corner"""
+    key = (tile_type, cell_size)
+    tile_surface = _tile_surfaces.get(key)
+    if tile_surface is None:
+        tile_surface = pygame.Surface((cell_size + 1, cell_size + 1))
+        tile_surface.fill(_TILE_COLORKEY)
+        draw_tile(tile_surface, tile_type, 0, 0, cell_size)
+        tile_surface.set_colorkey(_TILE_COLORKEY, pygame.RLEACCEL)
+        _tile_surfaces[key] = tile_surface
+    return tile_surface
+
+def get_tile_surfaces(cell_size: int) -> Dict[TileType, pygame.Surface]:
+    """Get every tile type's pre-drawn surface at cell_size, keyed by type"""
+    return {tile_type: get_tile_surface(tile_type, cell_size) for tile_type in TileType}
+
 def draw_floor_grid(surface: pygame.Surface, left: int, top: int, cell_size: int):
     """Draw a grid pattern that aligns with character movement"""
     # Very thin lines for the grid
@@ -1,6 +1,7 @@
 # ui_systems.py - All UI rendering and inventory/equipment systems
 import pygame
 import time
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass, field
 from game_constants import *
@@ -104,6 +105,7 @@ def organize_inventory_into_containers(player: Player) -> List[Container]:
     
     return containers
 
+@lru_cache(maxsize=32)
 def get_stat_modifier(stat_value: int) -> int:
     """Calculate ability modifier from stat value"""
     if stat_value <= 3:
@@ -435,7 +437,8 @@ def draw_spell_menu(surface: pygame.Surface, font: pygame.font.Font, spells: Lis
 
 # Inventory UI functions
 def draw_inventory_screen(surface: pygame.Surface, player: Player, selected_index: int, 
-                         font: pygame.font.Font, small_font: pygame.font.Font):
+                         font: pygame.font.Font, small_font: pygame.font.Font,
+                         containers: Optional[List[Container]] = None):
     """Draw inventory management screen showing containers"""
     surface.fill(COLOR_BLACK)
     
@@ -450,8 +453,9 @@ def draw_inventory_screen(surface: pygame.Surface, player: Player, selected_inde
     separator_x = screen_width // 3 + 30
     pygame.draw.line(surface, COLOR_WHITE, (separator_x, 80), (separator_x, screen_height - 100), 2)
     
-    # Get containers
-    containers = organize_inventory_into_containers(player)
+    # Get containers, unless the caller already organized them
+    if containers is None:
+        containers = organize_inventory_into_containers(player)
     
     # Left side - container list
     list_x = 20
@@ -581,7 +585,6 @@ def draw_equipment_screen(surface: pygame.Surface, player: Player, selected_slot
     pygame.draw.line(surface, COLOR_WHITE, (separator_x, 80), (separator_x, screen_height - 100), 2)
     
     # Equipment slots
-    equipment_slots = ['weapon', 'armor', 'shield', 'light']
     slot_names = {
         'weapon': 'Weapon',
         'armor': 'Armor', 
@@ -593,7 +596,7 @@ def draw_equipment_screen(surface: pygame.Surface, player: Player, selected_slot
     list_width = screen_width // 3
     y = 100
     
-    for slot in equipment_slots:
+    for slot in EQUIPMENT_SLOTS:
         # Highlight selected slot
         if slot == selected_slot:
             highlight_rect = pygame.Rect(list_x - 5, y - 5, list_width - 30, 60)